@@ -0,0 +1,297 @@
+# setup
+
+# 사용할 라이브러리 정리
+import os                      # 파일/폴더 경로 처리, 디렉토리 목록 조회
+import numpy as np             # 수치 계산
+import pandas as pd            # CSV 로딩 및 데이터프레임 처리
+
+# ================================================================
+# 데이터 품질(스키마) 검증
+# - CSV를 읽는 "같은 한 번의 패스" 안에서 청크마다 검사를 같이 수행
+# - 검사 항목마다 전체 데이터를 다시 훑지 않도록, 청크 단위 결과를
+#   누적 상태(state)에 더해 가는 방식으로 구현
+# - 검사 항목
+#   1) 필수 컬럼 누락
+#   2) 센서 값 범위 이탈
+#   3) 0/1 이 아닌 플래그 값
+#   4) 정의되지 않은 machine_status 코드
+#   5) (machine_id, timestamp) 중복 행
+#   6) 기계별 timestamp 간격(gap) 초과 / 시간 역순 행
+# ================================================================
+
+# ====== columns ======
+TIME_COL    = "timestamp"
+MACHINE_COL = "machine_id"
+STATUS_COL  = "machine_status"
+
+# 센서 컬럼과 허용 범위(최소, 최대)
+# - 데이터셋 설명(README)의 단위를 기준으로 넉넉하게 잡은 물리적 범위
+# - 현장 데이터에 맞게 값만 바꿔서 사용하면 됨
+SENSOR_RANGES = {
+    "temperature":              (-50.0, 200.0),
+    "vibration":                (0.0, 200.0),
+    "humidity":                 (0.0, 100.0),
+    "pressure":                 (0.0, 50.0),
+    "energy_consumption":       (0.0, 100.0),
+    "predicted_remaining_life": (0.0, 1000.0),
+}
+SENSOR_COLS = list(SENSOR_RANGES)
+
+# 0/1 값만 허용되는 플래그 컬럼 (mainO_data.py / mainO_data_rate.py에서 astype(int)로 쓰는 컬럼들)
+FLAG_COLS = ["maintenance_required", "anomaly_flag", "downtime_risk"]
+
+# machine_status 코드 (0: 대기, 1: 가동, 2: 고장)
+STATUS_CODES = [0, 1, 2]
+
+REQUIRED_COLS = [TIME_COL, MACHINE_COL, STATUS_COL] + SENSOR_COLS + FLAG_COLS + ["failure_type"]
+
+# 기계별 연속 기록 사이의 gap 기준
+# - max_gap 을 직접 주지 않으면, 기계마다 지금까지의 평균 기록 간격 × GAP_FACTOR 를 기준으로 씀
+#   (기계별 기록 주기가 제각각이고 불규칙해서 고정값 하나로는 정상 간격도 gap이 됨)
+# - 평균을 낼 간격이 MIN_GAP_SAMPLES 개 미만인 기계는 아직 판단하지 않음
+GAP_FACTOR = 20
+MIN_GAP_SAMPLES = 10
+
+# 리포트에 남길 알 수 없는 machine_status 값의 최대 개수 (리포트를 짧게 유지)
+MAX_STATUS_CODES = 20
+
+# 중복 검사용 키를 보관하는 기간 (기계별 마지막 timestamp 기준)
+# - 이보다 오래된 시점과 겹치는 행은 중복 대신 시간 역순(out_of_order)으로 잡힘
+DUP_HORIZON = pd.Timedelta("1D")
+
+
+# kagglehub가 내려받은 폴더에서 첫 번째 csv 파일 경로를 찾는 함수
+# - 기존 스크립트들의 "csv 파일 불러오기" 부분과 같은 규칙
+def find_csv(path):
+    files = sorted(os.listdir(path))
+    csv_file = [f for f in files if f.endswith('.csv')][0]
+    return os.path.join(path, csv_file)
+
+
+# 검사 결과를 누적할 상태(state)를 새로 만드는 함수
+# - 청크마다 validate_chunk()가 이 dict의 값을 더해 감
+def new_quality_state(max_gap=None):
+    return {
+        "rows": 0,
+        "missing_columns": [],
+        "null_counts": {},
+        "out_of_range": {c: 0 for c in SENSOR_COLS},
+        "bad_flags": {c: 0 for c in FLAG_COLS},
+        "unknown_status": 0,
+        "unknown_status_codes": set(),
+        "bad_timestamps": 0,
+        "duplicate_keys": 0,
+        "timestamp_gaps": 0,
+        "out_of_order": 0,
+        "max_gap": None if max_gap is None else pd.Timedelta(max_gap),
+        "largest_gap": pd.Timedelta(0),
+        # 중복 검사용: 최근 DUP_HORIZON 안의 (machine_id, timestamp, 해시값)
+        "_recent_keys": pd.DataFrame({MACHINE_COL: [], TIME_COL: pd.to_datetime([]),
+                                      "hash": np.array([], dtype=np.uint64)}),
+        # gap 검사용: 기계별 마지막 timestamp (다음 청크와 이어서 비교)
+        "_last_ts": {},
+        # gap 기준 계산용: 기계별 [간격 합(초), 간격 개수]
+        "_intervals": pd.DataFrame(columns=["sum", "count"], dtype=float),
+        "_checked_columns": False,
+    }
+
+
+# 한 청크(DataFrame)를 검사해서 state에 결과를 누적하는 함수
+# - 입력: 청크 DataFrame, new_quality_state()로 만든 state
+# - 출력: 컬럼명 공백을 정리한 청크 (로딩 결과로 그대로 사용)
+# - 모든 검사는 컬럼 단위 벡터 연산으로 처리 (행 단위 반복 없음)
+def validate_chunk(chunk, state):
+    # 컬럼명 앞/뒤 공백 때문에 KeyError가 나는 상황을 예방 (mainX_data.py와 동일)
+    chunk = chunk.copy()
+    chunk.columns = chunk.columns.str.strip()
+
+    # 1) 필수 컬럼 누락: 스키마는 첫 청크에서 한 번만 확인하면 충분
+    if not state["_checked_columns"]:
+        state["missing_columns"] = [c for c in REQUIRED_COLS if c not in chunk.columns]
+        state["_checked_columns"] = True
+
+    state["rows"] += len(chunk)
+
+    # 결측치 개수 (존재하는 필수 컬럼만)
+    present = [c for c in REQUIRED_COLS if c in chunk.columns]
+    for c, n in chunk[present].isna().sum().items():
+        if n:
+            state["null_counts"][c] = state["null_counts"].get(c, 0) + int(n)
+
+    # 2) 센서 값 범위 이탈 (숫자로 변환되지 않는 값도 범위 이탈로 간주)
+    for c, (lo, hi) in SENSOR_RANGES.items():
+        if c not in chunk.columns:
+            continue
+        v = pd.to_numeric(chunk[c], errors="coerce")
+        bad = (v < lo) | (v > hi) | (v.isna() & chunk[c].notna())
+        state["out_of_range"][c] += int(bad.sum())
+
+    # 3) 0/1 이 아닌 플래그 값
+    # - bool(True/False)이나 "0"/"1" 문자열도 0/1로 해석되면 정상으로 봄
+    for c in FLAG_COLS:
+        if c not in chunk.columns:
+            continue
+        col = chunk[c]
+        if not pd.api.types.is_numeric_dtype(col):
+            col = col.astype(str).str.strip().replace({"True": "1", "False": "0"})
+        v = pd.to_numeric(col, errors="coerce")
+        bad = ~v.isin([0, 1]) & chunk[c].notna()
+        state["bad_flags"][c] += int(bad.sum())
+
+    # 4) 정의되지 않은 machine_status 코드
+    if STATUS_COL in chunk.columns:
+        s = pd.to_numeric(chunk[STATUS_COL], errors="coerce")
+        bad = ~s.isin(STATUS_CODES) & chunk[STATUS_COL].notna()
+        state["unknown_status"] += int(bad.sum())
+        codes = state["unknown_status_codes"]
+        for v in chunk.loc[bad, STATUS_COL].unique()[:max(MAX_STATUS_CODES - len(codes), 0)]:
+            codes.add(v)
+
+    # 5), 6) 은 machine_id / timestamp 둘 다 있어야 검사 가능
+    if TIME_COL not in chunk.columns or MACHINE_COL not in chunk.columns:
+        return chunk
+
+    ts = pd.to_datetime(chunk[TIME_COL], errors="coerce")
+    state["bad_timestamps"] += int((ts.isna() & chunk[TIME_COL].notna()).sum())
+
+    keys = pd.DataFrame({MACHINE_COL: chunk[MACHINE_COL], TIME_COL: ts})
+    keys = keys.dropna()
+    if keys.empty:
+        return chunk
+
+    # 5) (machine_id, timestamp) 중복
+    # - 청크 안의 중복은 duplicated()로, 이전 청크와의 중복은 최근 키 해시와 np.isin 으로 확인
+    h = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    dup_in_chunk = pd.Series(h).duplicated().to_numpy()
+    recent = state["_recent_keys"]
+    dup_prev = np.isin(h, recent["hash"].to_numpy())
+    dup = dup_in_chunk | dup_prev
+    state["duplicate_keys"] += int(dup.sum())
+    new_keys = keys[~dup].assign(hash=h[~dup])
+
+    # 6) 기계별 timestamp 간격
+    # - 이전 청크의 기계별 마지막 timestamp를 앞에 붙여서 청크 경계의 간격도 계산
+    # - 같은 기계의 앞선 행(이전 청크 포함)보다 과거 시점인 행은 간격 계산에서 빼고
+    #   out_of_order로 따로 집계
+    #   (파일이 대체로 시간순으로 쌓여 있다는 가정. 다시 정렬하려면 전체 스캔이 필요함)
+    # - 5)에서 중복으로 센 행은 여기서 다시 세지 않음 (문제 행 하나는 한 번만 집계)
+    last = state["_last_ts"]
+    g = keys.groupby(MACHINE_COL, sort=False)[TIME_COL]
+    prev_ts = g.cummax().groupby(keys[MACHINE_COL], sort=False).shift()
+    prev_ts = pd.concat([prev_ts, pd.to_datetime(keys[MACHINE_COL].map(last))], axis=1).max(axis=1)
+    late = (keys[TIME_COL] < prev_ts).to_numpy() & ~dup
+    state["out_of_order"] += int(late.sum())
+    prev = pd.DataFrame({MACHINE_COL: list(last), TIME_COL: pd.to_datetime(list(last.values()))})
+    k = pd.concat([prev, keys[~late & ~dup]], ignore_index=True)
+    k = k.drop_duplicates().sort_values([MACHINE_COL, TIME_COL])
+    gaps = k.groupby(MACHINE_COL, sort=False)[TIME_COL].diff()
+    ok = gaps.notna()
+    gaps, gap_machine = gaps[ok], k.loc[ok, MACHINE_COL]
+    if state["max_gap"] is not None:
+        big = gaps[gaps > state["max_gap"]]
+    else:
+        # 기계별 평균 기록 간격을 누적해서 그 GAP_FACTOR 배를 넘는 간격만 gap으로 봄
+        sec = gaps.dt.total_seconds()
+        stats = sec.groupby(gap_machine).agg(["sum", "count"])
+        state["_intervals"] = state["_intervals"].add(stats, fill_value=0)
+        iv = state["_intervals"]
+        limit = (iv["sum"] / iv["count"] * GAP_FACTOR).where(iv["count"] >= MIN_GAP_SAMPLES)
+        big = gaps[(sec > gap_machine.map(limit)).to_numpy()]
+    state["timestamp_gaps"] += int(big.size)
+    if big.size:
+        state["largest_gap"] = max(state["largest_gap"], big.max())
+    last.update(k.groupby(MACHINE_COL, sort=False)[TIME_COL].max().to_dict())
+
+    # 중복 검사용 키는 기계별 마지막 timestamp 에서 DUP_HORIZON 이내인 것만 남김
+    # (gap 검사와 마찬가지로 대체로 시간순이라는 가정. 메모리는 최근 구간 크기로 제한됨)
+    recent = pd.concat([recent, new_keys], ignore_index=True) if len(recent) else new_keys
+    horizon = pd.to_datetime(recent[MACHINE_COL].map(last)) - DUP_HORIZON
+    state["_recent_keys"] = recent[recent[TIME_COL] >= horizon].reset_index(drop=True)
+
+    return chunk
+
+
+# CSV를 읽으면서 동시에 품질 검사를 수행하는 함수
+# - chunksize=None 이면 한 번에 읽고, 숫자를 주면 그 크기만큼 나눠 읽음
+# - keep=False 이면 데이터는 버리고 검사 결과만 반환 (대용량 파일 점검용)
+# - 출력: (DataFrame 또는 None, 품질 리포트 dict)
+# - max_gap=None 이면 기계별 평균 간격 × GAP_FACTOR 를 gap 기준으로 사용
+def load_with_validation(csv_path, chunksize=None, max_gap=None, keep=True):
+    state = new_quality_state(max_gap)
+
+    if chunksize is None:
+        chunks = [pd.read_csv(csv_path)]
+    else:
+        chunks = pd.read_csv(csv_path, chunksize=chunksize)
+
+    parts = []
+    for chunk in chunks:
+        chunk = validate_chunk(chunk, state)
+        if keep:
+            parts.append(chunk)
+
+    df = pd.concat(parts, ignore_index=True) if parts else None
+    return df, quality_report(state)
+
+
+# 누적된 state를 간단한 리포트(dict)로 정리하는 함수
+# - 내부용 키(_로 시작)는 제외하고, 0인 항목은 생략해서 짧게 유지
+# - ok: 필수 컬럼 결측치를 포함한 모든 검사 항목이 0일 때만 True
+def quality_report(state):
+    report = {
+        "rows": state["rows"],
+        "missing_columns": list(state["missing_columns"]),
+        "null_counts": dict(state["null_counts"]),
+        "out_of_range": {c: n for c, n in state["out_of_range"].items() if n},
+        "bad_flags": {c: n for c, n in state["bad_flags"].items() if n},
+        "unknown_status": state["unknown_status"],
+        "unknown_status_codes": sorted(map(str, state["unknown_status_codes"])),   # 최대 MAX_STATUS_CODES 개
+        "bad_timestamps": state["bad_timestamps"],
+        "duplicate_keys": state["duplicate_keys"],
+        "timestamp_gaps": state["timestamp_gaps"],
+        "out_of_order": state["out_of_order"],
+        "largest_gap": str(state["largest_gap"]),
+        "gap_threshold": (str(state["max_gap"]) if state["max_gap"] is not None
+                          else f"기계별 평균 간격 × {GAP_FACTOR}"),
+    }
+    problems = (
+        len(report["missing_columns"]) + sum(report["null_counts"].values())
+        + sum(report["out_of_range"].values())
+        + sum(report["bad_flags"].values()) + report["unknown_status"]
+        + report["bad_timestamps"] + report["duplicate_keys"] + report["timestamp_gaps"] + report["out_of_order"]
+    )
+    report["ok"] = problems == 0
+    return report
+
+
+# 리포트를 보기 좋게 출력 (m2_check.py의 요약 출력 형식을 따름)
+def print_quality_report(report):
+    print("\n" + "="*70)
+    print("데이터 품질 검증 결과")
+    print("-"*70)
+    print(f"전체 rows: {report['rows']:,}")
+    print(f"누락된 컬럼: {report['missing_columns'] or '없음'}")
+    print(f"결측치: {report['null_counts'] or '없음'}")
+    print(f"센서 범위 이탈: {report['out_of_range'] or '없음'}")
+    print(f"0/1 이 아닌 플래그: {report['bad_flags'] or '없음'}")
+    print(f"알 수 없는 machine_status: {report['unknown_status']:,} {report['unknown_status_codes']}")
+    print(f"timestamp 변환 실패: {report['bad_timestamps']:,}")
+    print(f"(machine_id, timestamp) 중복: {report['duplicate_keys']:,}")
+    print(f"timestamp gap: {report['timestamp_gaps']:,} (최대 {report['largest_gap']}, 기준: {report['gap_threshold']})")
+    print(f"시간 역순 행: {report['out_of_order']:,}")
+    print("-"*70)
+    print("== 결론 ==")
+    print("문제 없음" if report["ok"] else "품질 문제가 있습니다. 위 항목을 확인하세요.")
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    import kagglehub           # Kaggle 데이터셋 다운로드
+
+    # 데이터셋 다운로드 : kagglehub가 데이터셋 내려받고, 로컬에 저장된 폴더 경로 반환
+    path = kagglehub.dataset_download(
+        "ziya07/smart-manufacturing-iot-cloud-monitoring-dataset"
+    )
+
+    df, report = load_with_validation(find_csv(path), chunksize=100_000)
+    print_quality_report(report)
@@ -0,0 +1,326 @@
+# setup
+
+# 사용할 라이브러리 정리
+import io                      # 새로 추가된 바이트 블록을 CSV 로 읽기
+import os                      # 파일/폴더 경로 처리
+import pickle                  # 모니터 상태 저장/불러오기 (로컬 캐시용)
+import numpy as np             # 수치 계산
+import pandas as pd            # CSV 로딩 및 데이터프레임 처리
+
+from data_quality import SENSOR_RANGES, TIME_COL, MACHINE_COL, find_csv
+
+# ================================================================
+# 센서 분포 드리프트(변화) 모니터링
+# - README 인사이트: 센서 값이 기준(임계값)을 넘지 않아도 고장이 나는 경우가 있음
+#   → 고정 임계값 대신 "분포가 시간에 따라 달라지는지"를 감시
+# - 시간 구간(window: 기본 7일) × machine_id × 센서별로
+#   격자 히스토그램 + 개수/합/제곱합만 누적 (새로 들어온 행만 처리)
+# - 격자 경계는 처음 들어온 데이터(reference)의 센서별 분위수로 한 번 정해서 고정
+#   → 구간마다 reference 표본이 고르게 들어가서 좁은 범위에 몰린 센서도 구분됨
+# - 최근 구간(current)과 그 이전 전체(reference)를 비교해서
+#   PSI, KS(히스토그램 기반), CUSUM(구간 평균) 을 모든 기계에 대해 한 번에 계산
+# - 결과: 드리프트 점수 순으로 정렬한 (machine_id, sensor) 리포트
+# ================================================================
+
+SENSORS = list(SENSOR_RANGES)
+
+DRIFT_BINS = 20                # 센서별 격자 구간 수
+EDGE_FIT_ROWS = 10_000         # 격자 경계(분위수)를 정하기 전에 모을 최소 행 수
+WINDOW_FREQ = "7D"             # 시간 구간 단위 ("7D", "1D" 등 pandas 고정 주기 문자열)
+                               # 기계 50대가 약 1분에 한 행 → 기계당 하루 약 30행, 7일이면 약 200행
+KEEP_WINDOWS = 12              # 구간별로 따로 보관할 최근 구간 수
+                               # (더 오래된 구간은 reference 에 합쳐서 메모리/계산량을 일정하게 유지)
+BLOCK_BYTES = 64 * 2**20       # CSV 를 이어 읽을 때 한 번에 읽는 바이트 수
+
+PSI_ALERT = 0.25               # PSI 경보 기준 (0.1 미만 안정, 0.25 이상 큰 변화로 보는 관례)
+PSI_PRIOR = DRIFT_BINS         # PSI 계산 시 구간 비율을 합친 분포 쪽으로 당기는 가상 표본 수
+PSI_MIN_COUNT = 200            # PSI 를 경보/점수에 쓸 최소 현재 구간 표본 수 (적으면 PSI 자체가 불안정)
+CUSUM_K = 0.5                  # CUSUM 허용 편차 (표준화 단위)
+CUSUM_H = 5.0                  # CUSUM 경보 기준
+KS_ALPHA = 0.01                # KS 검정 유의수준
+
+
+# 빈 모니터 상태를 만드는 함수
+# - edges: 센서별 격자 안쪽 경계 (센서 수, 구간 수 - 1). EDGE_FIT_ROWS 행이 모이면 정해짐
+# - pending: 격자 경계를 정하기 전까지 모아 두는 행
+# - windows: 구간 시작 시각 → 히스토그램 (기계 수, 센서 수, 구간 수)
+# - moments: 구간 시작 시각 → [개수, 합, 제곱합] (기계 수, 센서 수, 3)
+# - ref_hist / ref_moments: KEEP_WINDOWS 밖으로 밀려난 오래된 구간들의 합
+# - offsets: 파일별로 처리한 바이트 위치
+def new_monitor(freq=WINDOW_FREQ, bins=DRIFT_BINS, keep_windows=KEEP_WINDOWS, fit_rows=EDGE_FIT_ROWS):
+    return {
+        "freq": freq,
+        "bins": bins,
+        "keep_windows": keep_windows,
+        "fit_rows": fit_rows,
+        "sensors": list(SENSORS),
+        "edges": None,
+        "pending": [],
+        "machines": [],
+        "windows": {},
+        "moments": {},
+        "ref_hist": np.zeros((0, len(SENSORS), bins), dtype=np.int64),
+        "ref_moments": np.zeros((0, len(SENSORS), 3)),
+        "offsets": {},
+    }
+
+
+# 새 기계가 나타나면 모든 배열의 기계 축(axis 0)을 늘림
+def _grow_machines(state, n_machines):
+    extra = n_machines - state["ref_hist"].shape[0]
+    if extra <= 0:
+        return
+    pad = lambda a: np.concatenate([a, np.zeros((extra,) + a.shape[1:], dtype=a.dtype)])
+    state["ref_hist"] = pad(state["ref_hist"])
+    state["ref_moments"] = pad(state["ref_moments"])
+    for w in state["windows"]:
+        state["windows"][w] = pad(state["windows"][w])
+        state["moments"][w] = pad(state["moments"][w])
+
+
+# 센서별 격자 경계를 데이터 분위수로 정하는 함수
+# - 모든 기계를 합친 분포의 1/bins, 2/bins, ... 분위수를 안쪽 경계로 사용
+#   (양 끝 구간은 열려 있어서 범위 밖으로 벗어난 값은 끝 구간에 쌓임)
+# - 값이 하나도 없는 센서는 SENSOR_RANGES 를 균등 분할
+def _fit_edges(state, frame):
+    nb = state["bins"]
+    levels = np.linspace(0, 1, nb + 1)[1:-1]
+    edges = []
+    for c in state["sensors"]:
+        v = pd.to_numeric(frame[c], errors="coerce").dropna() if c in frame.columns else pd.Series([])
+        if v.empty:
+            lo, hi = SENSOR_RANGES[c]
+            edges.append(np.linspace(lo, hi, nb + 1)[1:-1])
+        else:
+            edges.append(np.quantile(v.to_numpy(dtype=float), levels))
+    state["edges"] = np.array(edges)
+
+
+# 새 데이터(청크) 하나를 상태에 누적하는 함수
+# - 구간/기계/센서/격자 번호를 하나의 평면 인덱스로 묶어 np.bincount 한 번으로 집계
+#   (행 단위 반복 없이, 처리량은 청크 크기에 비례)
+def update_monitor(state, chunk):
+    chunk = chunk.copy()
+    chunk.columns = chunk.columns.str.strip()
+    ts = pd.to_datetime(chunk[TIME_COL], errors="coerce")
+    ok = ts.notna() & chunk[MACHINE_COL].notna()
+    if not ok.any():
+        return state
+    chunk, ts = chunk.loc[ok], ts[ok]
+
+    # 격자 경계가 아직 없으면 fit_rows 행이 모일 때까지 모아 두었다가 한꺼번에 처리
+    if state["edges"] is None:
+        state["pending"].append(chunk)
+        if sum(len(c) for c in state["pending"]) < state["fit_rows"]:
+            return state
+        chunk = pd.concat(state["pending"], ignore_index=True)
+        state["pending"] = []
+        _fit_edges(state, chunk)
+        ts = pd.to_datetime(chunk[TIME_COL])
+
+    # 기계 번호 (처음 보는 machine_id 는 뒤에 추가)
+    index = {m: i for i, m in enumerate(state["machines"])}
+    for m in pd.unique(chunk[MACHINE_COL]):
+        if m not in index:
+            index[m] = len(state["machines"])
+            state["machines"].append(m)
+    _grow_machines(state, len(state["machines"]))
+    mi = chunk[MACHINE_COL].map(index).to_numpy()
+
+    # 구간 번호
+    w_codes, w_uniques = pd.factorize(ts.dt.floor(state["freq"]))
+    nw, nm, ns, nb = len(w_uniques), len(state["machines"]), len(state["sensors"]), state["bins"]
+
+    hist = np.zeros((nw, nm, ns, nb), dtype=np.int64)
+    mom = np.zeros((nw, nm, ns, 3))
+    for si, c in enumerate(state["sensors"]):
+        if c not in chunk.columns:
+            continue
+        v = pd.to_numeric(chunk[c], errors="coerce").to_numpy(dtype=float)
+        good = ~np.isnan(v)
+        b = np.searchsorted(state["edges"][si], v[good], side="right")
+        cell = w_codes[good] * nm + mi[good]
+        hist[:, :, si, :] += np.bincount(cell * nb + b, minlength=nw * nm * nb).reshape(nw, nm, nb)
+        mom[:, :, si, 0] += np.bincount(cell, minlength=nw * nm).reshape(nw, nm)
+        mom[:, :, si, 1] += np.bincount(cell, weights=v[good], minlength=nw * nm).reshape(nw, nm)
+        mom[:, :, si, 2] += np.bincount(cell, weights=v[good] ** 2, minlength=nw * nm).reshape(nw, nm)
+
+    for k, w in enumerate(w_uniques):
+        if w in state["windows"]:
+            state["windows"][w] += hist[k]
+            state["moments"][w] += mom[k]
+        else:
+            state["windows"][w] = hist[k]
+            state["moments"][w] = mom[k]
+
+    # 오래된 구간은 reference 로 합침 (늦게 들어온 과거 데이터도 여기로 감)
+    while len(state["windows"]) > state["keep_windows"]:
+        oldest = min(state["windows"])
+        state["ref_hist"] += state["windows"].pop(oldest)
+        state["ref_moments"] += state["moments"].pop(oldest)
+    return state
+
+
+# CSV 에서 아직 처리하지 않은 부분만 읽어서 누적하는 함수
+# - 파일 끝에 행이 계속 추가되는(append-only) 로그를 가정
+# - 파일별로 처리한 바이트 위치(offsets)를 기억해서 다음 실행 때 그 위치로 바로 이동(seek)
+#   → 이미 처리한 행은 다시 읽지도 파싱하지도 않음
+# - 블록 끝의 줄바꿈 없는(아직 쓰는 중인) 마지막 줄은 다음 실행으로 넘김
+#   (값 안에 줄바꿈이 들어간 CSV 는 지원하지 않음)
+def update_from_csv(state, csv_path, block_bytes=BLOCK_BYTES):
+    key = os.path.abspath(csv_path)
+    with open(csv_path, "rb") as f:
+        header = f.readline()
+        names = pd.read_csv(io.BytesIO(header), nrows=0).columns
+        offset = state["offsets"].get(key, len(header))
+        if offset > os.path.getsize(csv_path):   # 파일이 새로 만들어졌으면 처음부터
+            offset = len(header)
+        f.seek(offset)
+        rest = b""
+        while True:
+            block = f.read(block_bytes)
+            if not block:
+                break
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            rest = block[cut:]
+            if cut:
+                update_monitor(state, pd.read_csv(io.BytesIO(block[:cut]), header=None, names=names))
+                offset += cut
+    state["offsets"][key] = offset
+    return state
+
+
+# 상태 저장 / 불러오기
+def save_monitor(state, path):
+    with open(path, "wb") as f:
+        pickle.dump(state, f)
+
+
+def load_monitor(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+# KS 통계량의 근사 p-value (Kolmogorov 분포 점근식, 배열 단위로 계산)
+# - λ 가 크면 교대급수 2 Σ (-1)^(k-1) exp(-2 k² λ²)
+# - λ 가 작으면 교대급수가 수렴하지 않아서, 같은 분포의 다른 표현
+#   1 - √(2π)/λ Σ exp(-(2k-1)² π² / (8 λ²)) 로 계산 (D = 0 → p = 1, λ 에 대해 단조 감소)
+def _ks_pvalue(d, n, m):
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        en = np.sqrt(n * m / (n + m))
+        lam = np.nan_to_num((en + 0.12 + 0.11 / en) * d, nan=0.0)
+        k = np.arange(1, 101).reshape((-1,) + (1,) * np.ndim(lam))
+        tail = 2 * np.sum((-1.0) ** (k - 1) * np.exp(-2 * (k ** 2) * lam ** 2), axis=0)
+        cdf = np.sqrt(2 * np.pi) / lam * np.sum(np.exp(-((2 * k - 1) ** 2) * np.pi ** 2 / (8 * lam ** 2)), axis=0)
+    p = np.where(lam < 1.18, 1 - np.nan_to_num(cdf), tail)
+    return np.clip(np.where(lam > 0, p, 1.0), 0, 1)
+
+
+# 드리프트 리포트를 만드는 함수
+# - current: 최근 몇 개 구간을 "현재"로 볼지 (나머지 이전 구간 전체가 reference)
+# - 모든 계산은 (기계 수, 센서 수[, 격자 수]) 배열 단위로 한 번에 수행
+#   계산량은 보관 중인 구간 수(keep_windows)에만 비례하고 쌓인 이력 길이와는 무관
+# - 출력: 점수(score) 내림차순으로 정렬한 DataFrame
+#   score = max(보정 PSI / PSI_ALERT, CUSUM / CUSUM_H), drift = PSI, KS, CUSUM 중 하나라도 경보
+#   (PSI 는 현재 구간 표본이 psi_min_count 이상일 때만 점수/경보에 사용)
+def drift_report(state, current=1, psi_alert=PSI_ALERT, cusum_k=CUSUM_K, cusum_h=CUSUM_H,
+                 ks_alpha=KS_ALPHA, psi_min_count=PSI_MIN_COUNT, psi_prior=PSI_PRIOR):
+    if current > state["keep_windows"]:
+        raise ValueError(f"current({current})는 keep_windows({state['keep_windows']}) 이하여야 합니다.")
+    windows = sorted(state["windows"])
+    if len(windows) <= current and not state["ref_moments"][..., 0].any():
+        raise ValueError("reference 로 쓸 과거 구간이 부족합니다.")
+
+    cur_w, past_w = windows[-current:], windows[:-current]
+    ref = state["ref_hist"] + sum((state["windows"][w] for w in past_w), np.zeros_like(state["ref_hist"]))
+    cur = sum(state["windows"][w] for w in cur_w)
+    n_ref = ref.sum(axis=-1).astype(float)
+    n_cur = cur.sum(axis=-1).astype(float)
+
+    # PSI: 두 분포의 비율을 합친 분포(mix) 쪽으로 가상 표본 psi_prior 개만큼 당겨서 계산
+    # - 표본이 적은 현재 구간의 빈 격자가 log(0) 으로 PSI 를 부풀리지 않음
+    # - 분포가 같을 때 PSI 의 기댓값은 약 c² × (값이 있는 격자 수 - 1) × (1/n_ref + 1/n_cur)
+    #   (c: 당긴 정도만큼 줄어든 비율 차이의 배율) → 이것을 빼서 보정 PSI(psi_adj)로 사용
+    n_all = (n_ref + n_cur)[..., None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mix = (ref + cur) / n_all
+        p = (ref + psi_prior * mix) / (n_ref[..., None] + psi_prior)
+        q = (cur + psi_prior * mix) / (n_cur[..., None] + psi_prior)
+        psi = np.sum(np.where(mix > 0, (q - p) * np.log(q / p), 0.0), axis=-1)
+        w_ref, w_cur = n_ref / (n_ref + psi_prior), n_cur / (n_cur + psi_prior)
+        c = (w_cur * n_ref + w_ref * n_cur) / (n_ref + n_cur)
+        occupied = (mix > 0).sum(axis=-1)
+        psi_adj = np.maximum(psi - c ** 2 * np.maximum(occupied - 1, 0) * (1 / n_ref + 1 / n_cur), 0)
+    psi, psi_adj = np.nan_to_num(psi), np.nan_to_num(psi_adj)
+
+    # KS: 격자 경계에서의 누적분포 차이 최댓값 (히스토그램 스케치 기반)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ks = np.max(np.abs(np.cumsum(ref, -1) / n_ref[..., None] - np.cumsum(cur, -1) / n_cur[..., None]),
+                    axis=-1)
+    ks_p = _ks_pvalue(ks, n_ref, n_cur)
+
+    # CUSUM: reference 평균/표준편차로 보관 중인 구간 평균을 시간순으로 표준화해서 양/음 방향 누적
+    # - 마지막 구간까지 누적한 값이 cusum (예전에 있었다가 사라진 변화는 다시 0 쪽으로 내려감)
+    mom = np.stack([state["moments"][w] for w in windows])     # (구간, 기계, 센서, 3)
+    base = state["ref_moments"] + mom[:len(past_w)].sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mu0 = base[..., 1] / base[..., 0]
+        sd0 = np.sqrt(np.maximum(base[..., 2] / base[..., 0] - mu0 ** 2, 0))
+        s_hi = np.zeros_like(mu0)
+        s_lo = np.zeros_like(mu0)
+        for t in range(len(windows)):
+            n_t = mom[t, ..., 0]
+            z = (mom[t, ..., 1] / n_t - mu0) / (sd0 / np.sqrt(n_t))
+            z = np.where((n_t > 0) & np.isfinite(z), z, 0.0)
+            s_hi = np.maximum(0, s_hi + z - cusum_k)
+            s_lo = np.maximum(0, s_lo - z - cusum_k)
+        cusum = np.maximum(s_hi, s_lo)
+        mean_ref = mu0
+        cur_sum = mom[len(past_w):].sum(axis=0)
+        mean_cur = cur_sum[..., 1] / cur_sum[..., 0]
+
+    nm, ns = psi.shape
+    report = pd.DataFrame({
+        "machine_id": np.repeat(np.array(state["machines"], dtype=object), ns),
+        "sensor": np.tile(state["sensors"], nm),
+        "n_ref": n_ref.ravel().astype(int),
+        "n_cur": n_cur.ravel().astype(int),
+        "mean_ref": mean_ref.ravel(),
+        "mean_cur": mean_cur.ravel(),
+        "psi": psi.ravel(),
+        "psi_adj": psi_adj.ravel(),
+        "ks": ks.ravel(),
+        "ks_pvalue": ks_p.ravel(),
+        "cusum": cusum.ravel(),
+    })
+    report = report[(report["n_ref"] > 0) & (report["n_cur"] > 0)].copy()
+    psi_term = np.where(report["n_cur"] >= psi_min_count, report["psi_adj"] / psi_alert, 0.0)
+    report["score"] = np.maximum(psi_term, report["cusum"] / cusum_h)
+    report["drift"] = (psi_term >= 1) | (report["cusum"] >= cusum_h) | (report["ks_pvalue"] < ks_alpha)
+    report = report.sort_values(["score", "ks"], ascending=False).reset_index(drop=True)
+    report.attrs["current_windows"] = [str(w) for w in cur_w]
+    return report
+
+
+if __name__ == "__main__":
+    import kagglehub           # Kaggle 데이터셋 다운로드
+
+    # 데이터셋 다운로드 : kagglehub가 데이터셋 내려받고, 로컬에 저장된 폴더 경로 반환
+    path = kagglehub.dataset_download(
+        "ziya07/smart-manufacturing-iot-cloud-monitoring-dataset"
+    )
+
+    # 이전 상태가 있으면 이어서, 새로 추가된 행만 처리
+    state_path = "drift_state.pkl"
+    state = load_monitor(state_path) if os.path.exists(state_path) else new_monitor()
+    update_from_csv(state, find_csv(path))
+    save_monitor(state, state_path)
+
+    report = drift_report(state, current=1)
+    print("\n" + "="*70)
+    print(f"드리프트 리포트 (현재 구간: {report.attrs['current_windows']})")
+    print("-"*70)
+    print(f"드리프트 경보: {int(report['drift'].sum()):,} / {len(report):,} (machine_id × sensor)")
+    print(report.head(20).round(3).to_string(index=False))
+    print("="*70 + "\n")
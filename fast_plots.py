@@ -0,0 +1,109 @@
+# setup
+
+# 사용할 라이브러리 정리
+import math                    # 정규분포 누적확률(erf)
+import numpy as np             # 수치 계산
+import pandas as pd            # 결측 제거 등 입력 정리
+
+# ================================================================
+# 대용량 데이터용 그래프 그리기 도우미
+# - plt.violinplot / ax.hist / ax.plot(ECDF)에 원본 배열을 통째로 넘기면
+#   그리는 시간과 SVG 크기가 행 수에 비례해서 커짐
+# - 여기서는 먼저 작은 요약(고정 격자 KDE, 구간 카운트, 점 수를 줄인 ECDF)을
+#   계산한 뒤 그 요약만 matplotlib에 넘김
+#   → 1억 행이든 1만 행이든 그려지는 점/막대 수는 같음
+# ================================================================
+
+KDE_POINTS = 256               # 바이올린 KDE 격자 점 수
+ECDF_MAX_ERROR = 0.001         # ECDF 세로(누적비율) 최대 오차
+
+
+# 결측 제거 후 float numpy 배열로 변환
+def _values(x):
+    return pd.Series(x).dropna().to_numpy(dtype=float)
+
+
+# 구간 카운트(히스토그램) 미리 계산
+# - np.histogram 과 같은 결과. range 나 경계 배열(bins)을 주면 여러 그룹이 같은 구간을 공유
+# - 값이 없으면 0 카운트 (구간 수만 주면 np.histogram 처럼 (0, 1) 구간)
+# - 출력: (counts, edges)
+def hist_counts(x, bins=30, range=None):
+    return np.histogram(_values(x), bins=bins, range=range)
+
+
+# 미리 계산한 구간 카운트로 히스토그램 그리기
+# - 막대마다 점 하나(weights)만 넘기므로 ax.hist 와 모양은 같고 데이터 크기는 bins 개
+def plot_hist(ax, counts, edges, **kwargs):
+    return ax.hist(edges[:-1], bins=edges, weights=counts, **kwargs)
+
+
+# 점 수를 줄인 ECDF
+# - 누적비율 0, e, 2e, ..., 1 (e = max_error) 에 해당하는 분위수만 뽑음
+# - 계단 모양(steps-post)으로 그리면, 두 점 사이에서 실제 ECDF 와의 차이는 항상 e 미만
+#   → 점 수는 최대 1/e + 1 개로 데이터 크기와 무관
+# - 출력: (x, y), 데이터가 없으면 (None, None)
+def ecdf_decimated(x, max_error=ECDF_MAX_ERROR):
+    x = _values(x)
+    if x.size == 0:
+        return None, None
+    # 원본 점이 목표 점 수보다 적으면 그대로 정확한 ECDF 반환
+    if x.size <= 1 / max_error:
+        x = np.sort(x)
+        return x, np.arange(1, x.size + 1) / x.size
+    levels = np.linspace(0, 1, int(np.ceil(1 / max_error)) + 1)
+    q = np.quantile(x, levels[1:], method="inverted_cdf")
+    # 첫 점은 (최솟값, 0) → 최솟값 ~ e 분위수 사이의 아래쪽 꼬리도 그려짐
+    return np.concatenate([[x.min()], q]), levels
+
+
+# ECDF 그리기 (계단 모양으로 그려야 오차 보장이 성립)
+def plot_ecdf(ax, x, y, **kwargs):
+    return ax.plot(x, y, drawstyle="steps-post", **kwargs)
+
+
+# 고정 격자 KDE (binned KDE)
+# - 값을 grid 개 격자에 한 번 세고(O(n)), 가우시안 커널을 격자 위에서 합성곱
+# - 대역폭은 Scott 규칙 (matplotlib violinplot 기본값과 동일)
+#   단, 이상치 하나로 범위가 넓어지거나 n 이 아주 크면 대역폭이 격자 간격보다 작아져서
+#   KDE 가 뾰족한 히스토그램이 되므로 최소 격자 간격 1칸으로 제한
+# - 양 끝에서 커널이 잘리지 않도록 격자를 (최소 - 3×대역폭) ~ (최대 + 3×대역폭)으로 잡음
+#   (seaborn violinplot 의 cut 과 같은 방식)
+# - 커널은 격자 점의 값 대신 격자 한 칸 안의 확률(정규분포 누적확률의 차이)을 사용
+#   → 대역폭이 격자 간격과 비슷해도 적분값이 1로 유지됨
+# - 출력: violin 에 그대로 넘길 수 있는 통계 dict (coords, vals, mean, median, min, max)
+def kde_stats(x, grid=KDE_POINTS, bw_method="scott"):
+    x = _values(x)
+    if x.size == 0:
+        return None
+    lo, hi = float(x.min()), float(x.max())
+    mean, median = float(x.mean()), float(np.median(x))
+    if hi == lo:
+        coords = np.linspace(lo, hi, grid)
+        vals = np.zeros(grid)
+        vals[grid // 2] = 1.0
+        return dict(coords=coords, vals=vals, mean=mean, median=median, min=lo, max=hi)
+
+    factor = x.size ** (-1 / 5) if bw_method == "scott" else float(bw_method)
+    bw = max(factor * x.std(ddof=1) if x.size > 1 else (hi - lo), (hi - lo) / (grid - 1))
+    coords = np.linspace(lo - 3 * bw, hi + 3 * bw, grid)
+    step = coords[1] - coords[0]
+    bw = max(bw, step)
+    counts = np.bincount(np.rint((x - coords[0]) / step).astype(np.int64), minlength=grid)[:grid]
+
+    # 커널은 ±4 표준편차까지만 (그 밖은 무시할 만큼 작음)
+    half = int(min(np.ceil(4 * bw / step), grid))
+    t = (np.arange(-half, half + 2) - 0.5) * step / (bw * math.sqrt(2))
+    kernel = np.diff(0.5 * np.array([math.erf(v) for v in t])) / step
+    vals = np.convolve(counts, kernel, mode="full")[half:half + grid] / x.size
+    return dict(coords=coords, vals=vals, mean=mean, median=median, min=lo, max=hi)
+
+
+# 미리 계산한 KDE 로 바이올린 플롯 그리기
+# - plt.violinplot(datasets) 대신 사용. 각 데이터의 격자 KDE만 matplotlib 에 넘김
+def plot_violin(ax, datasets, positions=None, showmeans=True, **kwargs):
+    stats = [kde_stats(d) for d in datasets]
+    if positions is None:
+        positions = np.arange(1, len(stats) + 1)
+    keep = [i for i, s in enumerate(stats) if s is not None]
+    return ax.violin([stats[i] for i in keep], positions=[positions[i] for i in keep],
+                     showmeans=showmeans, **kwargs)
@@ -0,0 +1,337 @@
+# setup
+
+# 사용할 라이브러리 정리
+import os                      # 파일/폴더 경로 처리, 디렉토리 목록 조회
+import sys                     # 명령행 인자(사이트 폴더 목록)
+import json                    # 부분 집계 저장/불러오기
+import numpy as np             # 수치 계산
+import pandas as pd            # CSV 로딩 및 데이터프레임 처리
+
+from data_quality import SENSOR_RANGES, find_csv
+
+# ================================================================
+# 여러 공장(사이트)의 유지보수 통계 연합 집계
+# - 각 사이트에서 자기 CSV로 "부분 집계(partial)"만 계산해서 JSON(수 KB)으로 보내고,
+#   중앙에서는 부분 집계끼리 더해서(merge) 전체 결과를 만듦
+# - 원본 CSV를 한 곳으로 모을 필요가 없음
+# - 포함하는 집계
+#   1) mainO_data.py      : cond × anomaly_flag / downtime_risk 교차표 (정확)
+#   2) mainO_data_rate.py : machine_status × maintenance 교차표,
+#                           P(maint=1 | anomaly_flag / downtime_risk), RUL 히스토그램 (정확)
+#   3) mainX_data.py      : 센서 분포 요약 (count/min/max 정확, mean/std 는 (개수, 평균, 편차제곱합)을
+#                           Chan 병렬 공식으로 합쳐서 한 번에 계산한 값과 부동소수 오차 범위에서 같음,
+#                           분위수는 고정 격자 히스토그램으로 계산 → 오차 ≤ 격자 폭)
+# ================================================================
+
+# 부분 집계끼리 합칠 때 반드시 같아야 하는 설정
+# - 기준값이 다르면 교차표를 더하는 의미가 없으므로 merge 시 확인
+DEFAULT_CONFIG = {
+    "temp_threshold": 90,      # mainO_data.py 온도 기준
+    "vib_threshold": 80,       # mainO_data.py 진동 기준
+    "rul_bin_width": 10,       # mainO_data_rate.py RUL 히스토그램 구간 폭
+    "grid_bins": 1000,         # 분위수용 고정 격자 구간 수 (클수록 정확, 결과도 커짐)
+    "features": ["humidity", "pressure", "energy_consumption"],
+}
+
+PARTIAL_VERSION = 2            # 2: 분포 요약을 sum/sumsq 대신 mean/m2 로 저장
+
+
+# 빈 부분 집계를 만드는 함수
+def empty_partial(config=None):
+    config = {**DEFAULT_CONFIG, **(config or {})}
+    return {
+        "version": PARTIAL_VERSION,
+        "config": config,
+        "sites": [],
+        "rows": 0,
+        # 1) cond(0/1) × 플래그(0/1) 2x2 카운트
+        "crosstab": {c: [[0, 0], [0, 0]] for c in ["anomaly_flag", "downtime_risk"]},
+        # 2) machine_status별 [maint=0 개수, maint=1 개수]
+        "status_maint": {},
+        #    플래그 값(0/1)별 [maint=1 개수, 전체 개수]
+        "maint_given": {c: {"0": [0, 0], "1": [0, 0]} for c in ["anomaly_flag", "downtime_risk"]},
+        #    maintenance(0/1)별 RUL 구간 카운트 {구간 번호: 개수}
+        "rul_hist": {"0": {}, "1": {}},
+        # 3) feature별, maintenance(0/1)별 분포 요약
+        "distribution": {f: {} for f in config["features"]},
+    }
+
+
+# 값 배열 하나의 분포 요약 (개수/평균/편차제곱합 + 고정 격자 히스토그램)
+# - 분산은 sumsq - n·mean² 로 구하면 평균이 표준편차보다 훨씬 클 때 자릿수가 사라지므로
+#   평균과 편차제곱합(m2 = Σ(x - mean)²)을 저장
+# - 격자는 SENSOR_RANGES의 (최소, 최대)를 grid_bins 등분
+# - 범위를 벗어난 값은 under/over 에 따로 셈
+def _summary(x, lo, hi, grid_bins):
+    width = (hi - lo) / grid_bins
+    idx = np.floor((x - lo) / width).astype(np.int64)
+    idx[x == hi] = grid_bins - 1
+    inside = (idx >= 0) & (idx < grid_bins)
+    counts = np.bincount(idx[inside], minlength=grid_bins)
+    nz = np.flatnonzero(counts)
+    return {
+        "count": int(x.size),
+        "mean": float(x.mean()) if x.size else 0.0,
+        "m2": float(np.square(x - x.mean()).sum()) if x.size else 0.0,
+        "min": float(x.min()) if x.size else None,
+        "max": float(x.max()) if x.size else None,
+        "under": int((idx < 0).sum()),
+        "over": int((idx >= grid_bins).sum()),
+        # 0이 아닌 구간만 저장 (sparse) → 전송량을 작게 유지
+        "grid": {str(i): int(counts[i]) for i in nz},
+    }
+
+
+# machine_status 값을 JSON 키로 바꾸는 함수
+# - 사이트/청크에 따라 같은 코드가 1 / 1.0 / "1" 로 읽힐 수 있어서 정수 코드로 맞춘 뒤 문자열로 저장
+#   (그대로 str() 하면 "1.0" 과 "1" 이 서로 다른 키가 되어 합칠 때 행이 중복됨)
+def _status_key(s):
+    v = float(s)
+    return str(int(v)) if v.is_integer() else str(v)
+
+
+# DataFrame 하나(또는 청크 하나)로 부분 집계를 계산하는 함수
+def partial_from_frame(df, config=None, site=None):
+    p = empty_partial(config)
+    cfg = p["config"]
+    df = df.copy()
+    df.columns = df.columns.str.strip()
+    if site is not None:
+        p["sites"].append(site)
+    p["rows"] = int(len(df))
+
+    maint = df["maintenance_required"].astype(int)
+    status = pd.to_numeric(df["machine_status"], errors="coerce")
+
+    # 1) mainO_data.py : machine_status 0/1 인 행에서 cond × 플래그
+    ms01 = status.isin([0, 1])
+    cond = ((df["temperature"] >= cfg["temp_threshold"]) |
+            (df["vibration"] >= cfg["vib_threshold"])).astype(int)
+    for c in p["crosstab"]:
+        ct = pd.crosstab(cond[ms01], df.loc[ms01, c].astype(int)).reindex(
+            index=[0, 1], columns=[0, 1], fill_value=0
+        )
+        p["crosstab"][c] = ct.to_numpy().tolist()
+
+    # 2) mainO_data_rate.py
+    ct = pd.crosstab(status, maint).reindex(columns=[0, 1], fill_value=0)
+    p["status_maint"] = {_status_key(s): [int(a), int(b)] for s, (a, b) in zip(ct.index, ct.to_numpy())}
+    for c in p["maint_given"]:
+        g = maint.groupby(df[c].astype(int)).agg(["sum", "count"])
+        for v in [0, 1]:
+            if v in g.index:
+                p["maint_given"][c][str(v)] = [int(g.loc[v, "sum"]), int(g.loc[v, "count"])]
+
+    rul = df["predicted_remaining_life"]
+    rul_bin = np.floor(rul / cfg["rul_bin_width"])
+    for s in [0, 1]:
+        vc = rul_bin[(maint == s) & rul.notna()].astype(np.int64).value_counts()
+        p["rul_hist"][str(s)] = {str(k): int(v) for k, v in vc.items()}
+
+    # 3) mainX_data.py : feature × maintenance 상태별 분포
+    for f in cfg["features"]:
+        lo, hi = SENSOR_RANGES[f]
+        for s in [0, 1]:
+            x = df.loc[maint == s, f].dropna().to_numpy(dtype=float)
+            p["distribution"][f][str(s)] = _summary(x, lo, hi, cfg["grid_bins"])
+    return p
+
+
+# CSV 하나를 청크 단위로 읽어서 부분 집계를 만드는 함수 (사이트에서 실행)
+def partial_from_csv(csv_path, config=None, site=None, chunksize=None):
+    if chunksize is None:
+        return partial_from_frame(pd.read_csv(csv_path), config, site)
+    parts = [partial_from_frame(chunk, config) for chunk in pd.read_csv(csv_path, chunksize=chunksize)]
+    merged = merge_partials(parts)
+    if site is not None:
+        merged["sites"] = [site]
+    return merged
+
+
+# 두 sparse 카운트 dict 더하기
+def _add_counts(a, b):
+    out = dict(a)
+    for k, v in b.items():
+        out[k] = out.get(k, 0) + v
+    return out
+
+
+# 분포 요약 두 개 합치기
+# - 평균/편차제곱합은 Chan 등의 병렬 분산 공식으로 합침
+def _merge_summary(a, b):
+    if not a or not a["count"]:
+        return dict(b)
+    if not b or not b["count"]:
+        return dict(a)
+    n = a["count"] + b["count"]
+    delta = b["mean"] - a["mean"]
+    mins = [v for v in (a["min"], b["min"]) if v is not None]
+    maxs = [v for v in (a["max"], b["max"]) if v is not None]
+    return {
+        "count": n,
+        "mean": a["mean"] + delta * b["count"] / n,
+        "m2": a["m2"] + b["m2"] + delta * delta * a["count"] * b["count"] / n,
+        "min": min(mins) if mins else None,
+        "max": max(maxs) if maxs else None,
+        "under": a["under"] + b["under"],
+        "over": a["over"] + b["over"],
+        "grid": _add_counts(a["grid"], b["grid"]),
+    }
+
+
+# 여러 부분 집계를 하나로 합치는 함수 (중앙에서 실행)
+# - 카운트는 더하기, 평균/편차제곱합은 Chan 공식으로 합쳐지므로 순서와 상관없이 같은 결과가 나옴
+#   (평균/표준편차는 부동소수 반올림 오차 범위 안에서 같음)
+def merge_partials(partials):
+    partials = list(partials)
+    if not partials:
+        raise ValueError("합칠 부분 집계가 없습니다.")
+    config = partials[0]["config"]
+    for q in partials:
+        if q.get("version") != PARTIAL_VERSION:
+            raise ValueError(f"지원하지 않는 부분 집계 버전입니다: {q.get('version')}")
+        if q["config"] != config:
+            raise ValueError("설정(config)이 다른 부분 집계는 합칠 수 없습니다.")
+
+    out = empty_partial(config)
+    for q in partials:
+        out["sites"] += q["sites"]
+        out["rows"] += q["rows"]
+        for c, m in q["crosstab"].items():
+            out["crosstab"][c] = (np.array(out["crosstab"][c]) + np.array(m)).tolist()
+        for s, (a, b) in q["status_maint"].items():
+            s = _status_key(s)   # 예전 버전 부분 집계의 "1.0" 같은 키도 맞춰서 합침
+            a0, b0 = out["status_maint"].get(s, [0, 0])
+            out["status_maint"][s] = [a0 + a, b0 + b]
+        for c, d in q["maint_given"].items():
+            for v, (k, n) in d.items():
+                k0, n0 = out["maint_given"][c][v]
+                out["maint_given"][c][v] = [k0 + k, n0 + n]
+        for s, h in q["rul_hist"].items():
+            out["rul_hist"][s] = _add_counts(out["rul_hist"][s], h)
+        for f, d in q["distribution"].items():
+            for s, summ in d.items():
+                out["distribution"][f][s] = _merge_summary(out["distribution"][f].get(s), summ)
+    return out
+
+
+# 격자 히스토그램에서 분위수 계산
+# - 정렬 후 ceil(q*n)번째 값이 들어 있는 구간을 찾아 구간 안에서 선형 보간
+# - 실제 분위수도 같은 구간 안에 있으므로 오차는 구간 폭(width) 이하
+# - 범위 밖(under/over) 구간에 걸리면 정확한 min/max 로 대신하고 오차는 NaN(보장 불가)
+def _quantile(summ, q, lo, hi, grid_bins):
+    n = summ["count"]
+    if n == 0:
+        return np.nan, np.nan
+    width = (hi - lo) / grid_bins
+    k = max(int(np.ceil(q * n)), 1)
+    if k <= summ["under"]:
+        return summ["min"], np.nan
+    if k > n - summ["over"]:
+        return summ["max"], np.nan
+    idx = np.array(sorted(int(i) for i in summ["grid"]))
+    cnt = np.array([summ["grid"][str(i)] for i in idx])
+    cum = np.cumsum(cnt) + summ["under"]
+    j = int(np.searchsorted(cum, k))
+    before = cum[j] - cnt[j]
+    value = lo + width * (idx[j] + (k - before - 0.5) / cnt[j])
+    return float(min(max(value, summ["min"]), summ["max"])), width
+
+
+# 부분 집계를 실제 분석 결과(DataFrame)로 바꾸는 함수
+# - 반환 dict 의 키는 기존 스크립트의 변수 이름과 맞춤
+#   (ct_anom, rt_anom, ct_risk, rt_risk, ct_ratio, p_maint_given_anom, p_maint_given_risk)
+def finalize(partial, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95)):
+    cfg = partial["config"]
+    res = {"rows": partial["rows"], "sites": partial["sites"]}
+
+    for c, key in [("anomaly_flag", "anom"), ("downtime_risk", "risk")]:
+        ct = pd.DataFrame(partial["crosstab"][c], index=[0, 1], columns=[0, 1])
+        ct.index.name, ct.columns.name = "cond", c
+        res[f"ct_{key}"] = ct
+        res[f"rt_{key}"] = ct.div(ct.sum(axis=1), axis=0) * 100
+
+    ct = pd.DataFrame.from_dict(partial["status_maint"], orient="index", columns=[0, 1])
+    ct.index = pd.to_numeric(ct.index)
+    ct = ct.sort_index()
+    ct.index.name, ct.columns.name = "machine_status", "maintenance_required"
+    res["ct"] = ct
+    res["ct_ratio"] = ct.div(ct.sum(axis=1), axis=0) * 100
+
+    for c, key in [("anomaly_flag", "anom"), ("downtime_risk", "risk")]:
+        d = partial["maint_given"][c]
+        res[f"p_maint_given_{key}"] = pd.Series(
+            {v: (d[str(v)][0] / d[str(v)][1] * 100) if d[str(v)][1] else np.nan for v in [0, 1]},
+            name="maintenance_required",
+        ).rename_axis(c)
+
+    bw = cfg["rul_bin_width"]
+    rul = pd.DataFrame({int(s): pd.Series({int(k): v for k, v in h.items()}, dtype="int64")
+                        for s, h in partial["rul_hist"].items()}).fillna(0).astype(int).sort_index()
+    rul.index = rul.index * bw
+    rul.index.name, rul.columns.name = "rul_bin_start", "maintenance_required"
+    res["rul_hist"] = rul
+
+    rows = []
+    for f, d in partial["distribution"].items():
+        lo, hi = SENSOR_RANGES[f]
+        for s, summ in sorted(d.items()):
+            n = summ["count"]
+            row = {"feature": f, "maintenance_required": int(s), "count": n,
+                   "mean": summ["mean"] if n else np.nan,
+                   "std": np.sqrt(summ["m2"] / (n - 1)) if n > 1 else np.nan,
+                   "min": summ["min"], "max": summ["max"]}
+            errs = []
+            for q in quantiles:
+                row[f"q{int(round(q * 100)):02d}"], err = _quantile(summ, q, lo, hi, cfg["grid_bins"])
+                errs.append(err)
+            # 분위수 최대 오차 (범위 밖 값 때문에 보장할 수 없으면 NaN)
+            row["q_max_error"] = np.nan if any(np.isnan(errs)) else max(errs)
+            rows.append(row)
+    res["distribution"] = pd.DataFrame(rows).set_index(["feature", "maintenance_required"])
+    return res
+
+
+# 부분 집계를 JSON 파일로 저장 / 불러오기
+def save_partial(partial, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(partial, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_partial(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# 로컬 테스트용: 폴더 여러 개를 사이트 여러 개로 보고 집계
+# - 각 폴더의 첫 번째 csv 로 부분 집계를 만들고(사이트 역할) 합침(중앙 역할)
+def aggregate_dirs(dirs, config=None, chunksize=None):
+    partials = [partial_from_csv(find_csv(d), config, site=os.path.basename(os.path.abspath(d)),
+                                 chunksize=chunksize) for d in dirs]
+    return merge_partials(partials)
+
+
+if __name__ == "__main__":
+    # 사용법: python federated.py <사이트 폴더1> <사이트 폴더2> ...
+    # 폴더를 주지 않으면 kagglehub 데이터셋 하나를 단일 사이트로 사용
+    dirs = sys.argv[1:]
+    if not dirs:
+        import kagglehub       # Kaggle 데이터셋 다운로드
+        dirs = [kagglehub.dataset_download(
+            "ziya07/smart-manufacturing-iot-cloud-monitoring-dataset"
+        )]
+
+    merged = aggregate_dirs(dirs, chunksize=100_000)
+    res = finalize(merged)
+
+    print("\n" + "="*70)
+    print(f"사이트 {len(res['sites'])}곳, 전체 rows: {res['rows']:,}")
+    print(f"부분 집계 크기: {len(json.dumps(merged)) / 1024:.1f} KB")
+    print("-"*70)
+    print("P(anomaly_flag | cond) [%]\n", res["rt_anom"].round(1))
+    print("P(downtime_risk | cond) [%]\n", res["rt_risk"].round(1))
+    print("machine_status별 유지보수 비율 [%]\n", res["ct_ratio"].round(1))
+    print("P(maint=1 | anomaly_flag) [%]\n", res["p_maint_given_anom"].round(1))
+    print("P(maint=1 | downtime_risk) [%]\n", res["p_maint_given_risk"].round(1))
+    print("분포 요약\n", res["distribution"].round(3))
+    print("="*70 + "\n")
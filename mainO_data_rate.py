@@ -8,6 +8,7 @@ import kagglehub               # Kaggle 데이터셋 다운로드
 import matplotlib.pyplot as plt  # 시각화(기본)
 import matplotlib.font_manager as fm  # 한글 폰트 설정용
 import seaborn as sns          # 시각화(고급)
+from fast_plots import hist_counts, plot_hist  # 대용량용 그래프 도우미
 
 # 데이터셋 다운로드
 path = kagglehub.dataset_download("ziya07/smart-manufacturing-iot-cloud-monitoring-dataset")
@@ -100,10 +101,9 @@ ax.grid(False)
 
 # (D) RUL 히스토그램
 ax = axes[1, 1]
-ax.hist(d.loc[d[MAINT_COL] == 0, PRED_COL], bins=bins, alpha=0.5, edgecolor="black",
-        label="maintenance = 0")
-ax.hist(d.loc[d[MAINT_COL] == 1, PRED_COL], bins=bins, alpha=0.5, edgecolor="black",
-        label="maintenance = 1")
+for s in [0, 1]:
+    counts, edges = hist_counts(d.loc[d[MAINT_COL] == s, PRED_COL], bins=bins)
+    plot_hist(ax, counts, edges, alpha=0.5, edgecolor="black", label=f"maintenance = {s}")
 ax.set_title("RUL 분포 비교", fontproperties=fp, fontsize=TITLE_FS)
 ax.set_xlabel(PRED_COL, fontsize=LABEL_FS)
 ax.set_ylabel("count", fontsize=LABEL_FS)
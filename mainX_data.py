@@ -8,6 +8,7 @@ import kagglehub               # Kaggle 데이터셋 다운로드
 import matplotlib.pyplot as plt  # 시각화(기본)
 import matplotlib.font_manager as fm  # 한글 폰트 설정용
 import seaborn as sns          # 시각화(고급)
+from fast_plots import hist_counts, plot_hist, ecdf_decimated, plot_ecdf  # 대용량용 그래프 도우미
 
 # 데이터셋 다운로드 : kagglehub가 데이터셋 내려받고, 로컬에 저장된 폴더 경로 반환
 path = kagglehub.dataset_download(
@@ -49,15 +50,11 @@ df.columns = df.columns.str.strip()
 
 # 경험적 누적분포함수(ECDF)를 계산하는 함수
 # - 입력: 숫자 데이터(Series/array)
-# - 출력: (정렬된 x값, 누적비율 y값)
+# - 출력: (x값, 누적비율 y값)
 # - 빈 배열이면 (None, None)을 반환하여 이후 plot에서 건너뛰게 함
+# - 데이터가 많으면 누적비율 0.001 간격의 점만 남김 (세로 오차 최대 0.001, fast_plots.py 참고)
 def ecdf(x):
-    x = pd.Series(x).dropna().to_numpy()  # 결측 제거 후 numpy 배열로 변환
-    x = np.sort(x)                        # ECDF는 x가 오름차순이어야 선이 자연스럽게 연결됨
-    if x.size == 0:
-        return None, None
-    y = np.arange(1, x.size + 1) / x.size # 1/n, 2/n, ..., n/n 형태의 누적비율
-    return x, y
+    return ecdf_decimated(x)
 
 # maintenance_required에 실제로 존재하는 상태값(예: [0, 1])만 추출
 # - 결측치 제거
@@ -100,15 +97,18 @@ for j, feature in enumerate(features):
         if sub.empty:
             continue
 
-        # hist 주요 옵션 설명
+        # 구간 카운트를 먼저 계산하고 막대 개수만큼만 그리도록 넘김
         # - bins=30: 구간 개수(더 크면 더 촘촘하지만 노이즈가 늘 수 있음)
+        # - 원본 배열을 ax.hist에 통째로 넘기지 않아서 행 수가 많아도 그리는 시간이 같음
+        counts, edges = hist_counts(sub, bins=30)
+
+        # hist 주요 옵션 설명
         # - density=False: y축을 '빈도수(count)'로 표시 (True면 확률밀도)
         # - alpha=0.35: 두 상태를 겹쳐 그릴 때 서로 보이도록 반투명 처리
         # - edgecolor="black": 막대 경계를 검정으로 줘서 구간이 또렷하게 보이게 함
         # - label=...: 범례에 표시될 텍스트(0/1을 사람이 보기 좋게)
-        ax_hist.hist(
-            sub,
-            bins=30,
+        plot_hist(
+            ax_hist, counts, edges,
             density=False,
             alpha=0.35,
             edgecolor="black",
@@ -142,11 +142,11 @@ for j, feature in enumerate(features):
         if x is None:
             continue
 
-        # 선 그래프로 ECDF를 그림
+        # 계단 모양 선 그래프로 ECDF를 그림
         # - x축: feature 값
         # - y축: 해당 값 이하의 비율(누적)
-        ax_cdf.plot(
-            x, y,
+        plot_ecdf(
+            ax_cdf, x, y,
             label=maintenance_name.get(s, str(s))
         )
 
@@ -0,0 +1,876 @@
+# setup
+
+# 사용할 라이브러리 정리
+import os                      # 파일/폴더 경로 처리, 디렉토리 목록 조회
+import json                    # 캐시 목록(manifest) 저장
+import hashlib                 # 데이터/파라미터/코드 지문(hash) 계산
+import inspect                 # 셀 함수의 소스코드를 지문에 포함
+import numpy as np             # 수치 계산
+import pandas as pd            # CSV 로딩 및 데이터프레임 처리
+import matplotlib.pyplot as plt  # 시각화(기본)
+import seaborn as sns          # 시각화(고급)
+
+from data_quality import load_with_validation, find_csv
+from fast_plots import hist_counts, plot_hist, ecdf_decimated, plot_ecdf, plot_violin
+
+# ================================================================
+# 결과 리포트 빌더
+# - result.ipynb / DataResult.ipynb 의 분석을 셀(cell) 단위 함수로 옮겨서
+#   노트북 전체를 다시 실행하지 않고 필요한 셀만 다시 계산
+# - 각 셀은 사용하는 "컬럼"과 "파라미터"를 선언하고,
+#   (셀 코드와 셀이 쓰는 도우미 함수/설정 + 사용 파라미터 값 + 사용 컬럼 데이터)의
+#   지문이 바뀐 셀만 재실행
+# - 그림은 노트북에 base64로 넣지 않고 figures/ 아래 png 파일로 따로 저장,
+#   report.md 는 그 파일을 링크만 하므로 결과물이 작게 유지됨
+# ================================================================
+
+# 리포트 기본 파라미터 (셀마다 필요한 것만 골라 지문에 포함)
+DEFAULT_PARAMS = {
+    "temp_threshold": 90,      # 온도 기준 (mainO_data.py / m2_check.py)
+    "vib_threshold": 80,       # 진동 기준
+    "life_threshold": 20,      # 예측 잔여수명 기준
+    "hist_bins": 30,           # mainX_data.py 히스토그램 구간 수
+    "sensor_bins": 50,         # 노트북 센서 히스토그램 구간 수
+    "rul_bin_width": 10,       # mainO_data_rate.py RUL 히스토그램 구간 폭
+    "rul_low_bins": 25,        # 잔여수명 기준 미만 히스토그램 구간 수
+    "detail_bins": 40,         # Overheating / 제외 조건 적용 후 히스토그램 구간 수
+    "dpi": 100,                # 저장할 그림 해상도
+}
+
+SENSOR_METRICS = ["temperature", "vibration", "humidity", "pressure", "energy_consumption"]
+
+# 셀 목록 (노트북 순서대로)
+# - name   : 셀 이름 (캐시 키, 그림 파일 이름에 사용)
+# - title  : 리포트에 표시할 제목
+# - columns: 셀이 읽는 데이터 컬럼 ("*"이면 전체 컬럼)
+# - params : 셀이 읽는 파라미터
+# - deps   : 셀 함수가 직접 부르지 않지만 결과에 영향을 주는 함수 (예: 품질 검사)
+CELLS = []
+
+# 코드 지문을 따라갈 모듈 (이 파일 + 그래프/품질 검사 도우미)
+TRACKED_MODULES = {__name__, "fast_plots", "data_quality"}
+
+
+# 셀 함수를 CELLS 목록에 등록하는 데코레이터
+def cell(name, title, columns, params=(), deps=()):
+    def register(func):
+        CELLS.append({
+            "name": name, "title": title,
+            "columns": list(columns), "params": list(params), "func": func,
+            "deps": list(deps),
+        })
+        return func
+    return register
+
+
+# ======================================
+# 셀 정의
+# - 입력: ctx(dict: df, quality, params)
+# - 출력: matplotlib Figure(그림 셀) 또는 문자열(텍스트 셀)
+# ======================================
+
+# 데이터 품질 검증 결과 (data_quality.py)
+# - 청크 경계에 따라 gap/중복 검사 결과가 달라질 수 있어서 chunksize 도 지문에 포함
+@cell("quality", "데이터 품질 검증", columns=["*"], params=["chunksize"], deps=[load_with_validation])
+def cell_quality(ctx):
+    return json.dumps(ctx["quality"], ensure_ascii=False, indent=2)
+
+
+# 유지보수 시각화 (고장 유형 개수, 유지보수 필요 비율)
+@cell("overview", "Failure Type / Maintenance Required",
+      columns=["failure_type", "maintenance_required"])
+def cell_overview(ctx):
+    df = ctx["df"]
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+
+    failure_counts = df["failure_type"].value_counts()
+    failure_colors = plt.cm.Set3(np.arange(len(failure_counts)) / len(failure_counts))
+    bars = ax1.bar(range(len(failure_counts)), failure_counts.values,
+                   color=failure_colors, edgecolor="black")
+    ax1.set_title("Failure Type Distribution", fontsize=14, fontweight="bold")
+    ax1.set_xlabel("Failure Type")
+    ax1.set_ylabel("Count")
+    ax1.set_xticks(range(len(failure_counts)))
+    ax1.set_xticklabels(failure_counts.index, rotation=45, ha="right")
+    for bar, count in zip(bars, failure_counts.values):
+        ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height(),
+                 f"{count:,}", ha="center", va="bottom", fontweight="bold")
+
+    maintenance_pct = df["maintenance_required"].value_counts(normalize=True).sort_index() * 100
+    ax2.pie(maintenance_pct, labels=["Not Required", "Required"][:len(maintenance_pct)],
+            autopct="%1.1f%%", colors=["#95a5a6", "#3498db"], startangle=90,
+            wedgeprops=dict(edgecolor="black"))
+    ax2.set_title("Maintenance Required Status", fontsize=14, fontweight="bold")
+    return fig
+
+
+# 머신 별 센서 평균 상위 20개
+@cell("machine_stats", "Top 20 Machines by Sensor Mean",
+      columns=["machine_id"] + SENSOR_METRICS)
+def cell_machine_stats(ctx):
+    df = ctx["df"]
+    fig, axes = plt.subplots(3, 2, figsize=(16, 15))
+    axes = axes.flatten()
+    colors = ["#e74c3c", "#3498db", "#2ecc71", "#9b59b6", "#f39c12"]
+
+    # 평균/표준편차를 센서 5개에 대해 groupby 한 번으로 계산
+    stats = df.groupby("machine_id")[SENSOR_METRICS].agg(["mean", "std"])
+    for idx, metric in enumerate(SENSOR_METRICS):
+        m = stats[metric].sort_values("mean", ascending=False).head(20)
+        x_pos = np.arange(len(m))
+        axes[idx].bar(x_pos, m["mean"], color=colors[idx], alpha=0.7,
+                      yerr=m["std"], capsize=5, error_kw={"elinewidth": 1})
+        axes[idx].set_title(f"Top 20 Machines by {metric.title()} Mean",
+                            fontsize=12, fontweight="bold")
+        axes[idx].set_xlabel("Machine ID")
+        axes[idx].set_ylabel(f"Average {metric.title()}")
+        axes[idx].set_xticks(x_pos)
+        axes[idx].set_xticklabels(m.index, rotation=45, ha="right")
+        axes[idx].grid(True, alpha=0.3, axis="y")
+    axes[-1].axis("off")
+    return fig
+
+
+# 센서별 히스토그램
+@cell("sensor_hist", "Sensor Distributions",
+      columns=SENSOR_METRICS + ["downtime_risk"], params=["sensor_bins"])
+def cell_sensor_hist(ctx):
+    df, p = ctx["df"], ctx["params"]
+    fig, axes = plt.subplots(3, 2, figsize=(15, 12))
+    for ax, col in zip(axes.flat, SENSOR_METRICS + ["downtime_risk"]):
+        counts, edges = hist_counts(df[col], bins=p["sensor_bins"])
+        plot_hist(ax, counts, edges, edgecolor="black", color="orange")
+        ax.set_title(f"{col} Distribution")
+        ax.set_xlabel(col)
+        ax.set_ylabel("Frequency")
+    return fig
+
+
+# machine_status 별 센서 히스토그램
+@cell("status_hist", "Sensors by Machine Status",
+      columns=["machine_status"] + SENSOR_METRICS, params=["sensor_bins"])
+def cell_status_hist(ctx):
+    df, p = ctx["df"], ctx["params"]
+    status_labels = {0: "Idle (0)", 1: "Running (1)", 2: "Failure (2)"}
+    fig, axes = plt.subplots(3, 2, figsize=(15, 15))
+    for ax, col in zip(axes.flat, SENSOR_METRICS):
+        for status, label in status_labels.items():
+            data = df.loc[df["machine_status"] == status, col].dropna()
+            counts, edges = hist_counts(data, bins=p["sensor_bins"])
+            plot_hist(ax, counts, edges, alpha=0.5, edgecolor="black",
+                      label=f"{label} (mean={data.mean():.2f})")
+        ax.set_title(f"{col} by Machine Status")
+        ax.set_xlabel(col)
+        ax.set_ylabel("Frequency")
+        ax.legend()
+    axes.flat[-1].axis("off")
+    return fig
+
+
+# 노트북 21~31 셀의 공통 제외 조건 (온도 > 기준, 진동 > 기준, 잔여수명 < 기준 중 하나라도 해당)
+def _exclude_strict(df, p):
+    return (
+        (df["temperature"] > p["temp_threshold"]) |
+        (df["vibration"] > p["vib_threshold"]) |
+        (df["predicted_remaining_life"] < p["life_threshold"])
+    )
+
+
+# 센서별로 maintenance_required 0/1 히스토그램을 겹쳐 그리는 그림 (노트북 10, 32~36 셀 공통)
+def _maintenance_hist(df, cols, bins):
+    fig, axes = plt.subplots(3, 2, figsize=(15, 15))
+    for ax, col in zip(axes.flat, cols):
+        for s, label, color in [(0, "Normal (0)", "blue"), (1, "Maintenance Required (1)", "red")]:
+            counts, edges = hist_counts(df.loc[df["maintenance_required"] == s, col], bins=bins)
+            plot_hist(ax, counts, edges, alpha=0.6, label=label, color=color, edgecolor="black")
+        ax.set_title(f"{col} by Maintenance Status")
+        ax.set_xlabel(col)
+        ax.set_ylabel("Frequency")
+        ax.legend()
+    for ax in axes.flat[len(cols):]:
+        ax.axis("off")
+    return fig
+
+
+# 유지보수 여부 / 기계별 개수, 기계별 대기 상태(=0) 횟수
+@cell("counts", "maintenance_required / machine_id 개수",
+      columns=["maintenance_required", "machine_id", "machine_status"])
+def cell_counts(ctx):
+    df = ctx["df"]
+    idle = df[df["machine_status"] == 0].groupby("machine_id").size()
+    return "\n\n".join([
+        df["maintenance_required"].value_counts().to_string(),
+        df["machine_id"].value_counts().to_string(),
+        "대기 상태(machine_status = 0) 횟수\n" + idle.to_string(),
+    ])
+
+
+# 정상(0) / 정비 필요(1) 별 센서 히스토그램
+@cell("maintenance_hist", "Sensors by Maintenance Status",
+      columns=["maintenance_required"] + SENSOR_METRICS + ["downtime_risk"], params=["sensor_bins"])
+def cell_maintenance_hist(ctx):
+    df, p = ctx["df"], ctx["params"]
+    return _maintenance_hist(df, SENSOR_METRICS + ["downtime_risk"], p["sensor_bins"])
+
+
+# machine_status 별로 나눠 본 센서 분포 (행: 상태, 열: 센서)
+@cell("status_split", "Sensor Distributions per Machine Status",
+      columns=["machine_status"] + SENSOR_METRICS, params=["sensor_bins"])
+def cell_status_split(ctx):
+    df, p = ctx["df"], ctx["params"]
+    status_labels = {0: "Idle (0)", 1: "Running (1)", 2: "Failure (2)"}
+    fig, axes = plt.subplots(len(status_labels), len(SENSOR_METRICS), figsize=(25, 13))
+    for row, (status, label) in enumerate(status_labels.items()):
+        subset = df.loc[df["machine_status"] == status]
+        for ax, col in zip(axes[row], SENSOR_METRICS):
+            counts, edges = hist_counts(subset[col], bins=p["sensor_bins"])
+            plot_hist(ax, counts, edges, alpha=0.7, edgecolor="black")
+            ax.set_title(f"{col} Distribution - {label}")
+            ax.set_xlabel(col)
+            ax.set_ylabel("Frequency")
+    return fig
+
+
+# 예측 잔여수명(RUL) 분포: 유지보수 여부별 / 상태별 / 기준 미만에서 유지보수 여부별
+@cell("rul_hist", "Predicted Remaining Life",
+      columns=["predicted_remaining_life", "maintenance_required", "machine_status"],
+      params=["sensor_bins", "life_threshold", "rul_low_bins"])
+def cell_rul_hist(ctx):
+    df, p = ctx["df"], ctx["params"]
+    life = df["predicted_remaining_life"]
+    low = life < p["life_threshold"]
+    fig, axes = plt.subplots(1, 3, figsize=(24, 6))
+
+    groups = [
+        (axes[0], "maintenance_required", [(0, "Normal (0)", "blue"), (1, "Maintenance Required (1)", "red")],
+         life.notna(), p["sensor_bins"], 0.6, "Predicted Remaining Life by Maintenance Status"),
+        (axes[1], "machine_status", [(0, "Idle (0)", "gray"), (1, "Running (1)", "green"), (2, "Failure (2)", "red")],
+         life.notna(), p["sensor_bins"], 0.5, "Predicted Remaining Life by Machine Status"),
+        (axes[2], "maintenance_required", [(0, "Normal (0)", "blue"), (1, "Maintenance Required (1)", "red")],
+         low, p["rul_low_bins"], 0.6, f"Predicted Remaining Life < {p['life_threshold']} by Maintenance Status"),
+    ]
+    for ax, by, levels, mask, bins, alpha, title in groups:
+        for value, label, color in levels:
+            counts, edges = hist_counts(life[mask & (df[by] == value)], bins=bins)
+            plot_hist(ax, counts, edges, alpha=alpha, label=label, color=color, edgecolor="black")
+        ax.set_title(title)
+        ax.set_xlabel("Predicted Remaining Life")
+        ax.set_ylabel("Frequency")
+        ax.legend()
+        ax.grid(axis="y")
+    return fig
+
+
+# 잔여수명 기준 이상인 데이터에서 정상 / 정비 필요 센서 박스플롯
+@cell("life_boxplot", "Sensor Distribution (Life ≥ threshold)",
+      columns=["predicted_remaining_life", "maintenance_required"] + SENSOR_METRICS,
+      params=["life_threshold"])
+def cell_life_boxplot(ctx):
+    df, p = ctx["df"], ctx["params"]
+    alive = df["predicted_remaining_life"] >= p["life_threshold"]
+    normal = df.loc[alive & (df["maintenance_required"] == 0)]
+    exceptions = df.loc[alive & (df["maintenance_required"] == 1)]
+    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
+    for ax, col in zip(axes.flat, SENSOR_METRICS):
+        box = ax.boxplot([normal[col].dropna(), exceptions[col].dropna()],
+                         tick_labels=["Normal (0)", "Maintenance Required (1)"], patch_artist=True)
+        for patch in box["boxes"]:
+            patch.set_facecolor("orange")
+        ax.set_title(f"{col} Distribution (Life ≥ {p['life_threshold']})")
+        ax.set_ylabel(col)
+    axes.flat[-1].axis("off")
+    return fig
+
+
+# 온도 / 진동 / 잔여수명 기준별 유지보수 비율
+@cell("threshold_counts", "기준별 유지보수 비율",
+      columns=["temperature", "vibration", "predicted_remaining_life", "maintenance_required"],
+      params=["temp_threshold", "vib_threshold", "life_threshold"])
+def cell_threshold_counts(ctx):
+    df, p = ctx["df"], ctx["params"]
+    checks = [
+        (f"온도 > {p['temp_threshold']}도", df["temperature"] > p["temp_threshold"]),
+        (f"진동 > {p['vib_threshold']}", df["vibration"] > p["vib_threshold"]),
+        (f"수명 < {p['life_threshold']}", df["predicted_remaining_life"] < p["life_threshold"]),
+    ]
+    lines = []
+    for label, mask in checks:
+        m = df.loc[mask, "maintenance_required"]
+        count_0, count_1 = int((m == 0).sum()), int((m == 1).sum())
+        total = count_0 + count_1
+        lines += [
+            f"{label}일 때",
+            f"정상 상태 개수 (0): {count_0:,}",
+            f"정비 필요 개수 (1): {count_1:,}",
+            f"전체 개수: {total:,}",
+            f"유지보수 비율: {count_1 / total if total else 0:.2%}",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+# 제외 조건 적용 후 failure_type × maintenance_required 개수
+# - sns.countplot 대신 교차표로 미리 센 뒤 막대만 그림
+@cell("failure_type_counts", "Failure Type vs Maintenance Required (After Filtering)",
+      columns=["temperature", "vibration", "predicted_remaining_life", "failure_type",
+               "maintenance_required"],
+      params=["temp_threshold", "vib_threshold", "life_threshold"])
+def cell_failure_type_counts(ctx):
+    df, p = ctx["df"], ctx["params"]
+    remaining = df.loc[~_exclude_strict(df, p)]
+    ct = pd.crosstab(remaining["failure_type"], remaining["maintenance_required"].astype(int))
+    ct = ct.reindex(columns=[0, 1], fill_value=0)
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ct.plot(kind="bar", ax=ax, width=0.8)
+    for container in ax.containers:
+        ax.bar_label(container, label_type="edge", fontsize=9)
+    ax.set_title("Failure Type vs Maintenance Required (After Filtering)")
+    ax.set_xlabel("Failure Type")
+    ax.set_ylabel("Count")
+    ax.legend(title="Maintenance Required", labels=["No (0)", "Yes (1)"])
+    ax.tick_params(axis="x", labelrotation=30)
+    return fig
+
+
+# 제외 조건 적용 후 남은 데이터의 유지보수 개수
+@cell("remaining_counts", "제외 조건 적용 후 maintenance_required 개수",
+      columns=["temperature", "vibration", "predicted_remaining_life", "failure_type",
+               "maintenance_required"],
+      params=["temp_threshold", "vib_threshold", "life_threshold"])
+def cell_remaining_counts(ctx):
+    df, p = ctx["df"], ctx["params"]
+    remaining = df.loc[~_exclude_strict(df, p)]
+    normal_and_no_maintenance = int(
+        ((remaining["failure_type"] == "Normal") & (remaining["maintenance_required"] == 0)).sum()
+    )
+    return "\n".join([
+        remaining["maintenance_required"].value_counts().to_string(),
+        f"'Normal' & 유지보수 필요 없음 (0) 개수: {normal_and_no_maintenance:,}",
+    ])
+
+
+# 제외 조건 적용 후 Overheating 데이터의 온도 분포와 진동 / 잔여수명 관계
+@cell("overheating", "Overheating (After Filtering)",
+      columns=["temperature", "vibration", "predicted_remaining_life", "failure_type",
+               "maintenance_required"],
+      params=["temp_threshold", "vib_threshold", "life_threshold", "detail_bins"])
+def cell_overheating(ctx):
+    df, p = ctx["df"], ctx["params"]
+    remaining = df.loc[~_exclude_strict(df, p)]
+    oh = remaining.loc[remaining["failure_type"] == "Overheating"]
+    fig, axes = plt.subplots(2, 2, figsize=(20, 12))
+
+    ax = axes[0, 0]
+    counts, edges = hist_counts(oh["temperature"], bins=p["detail_bins"])
+    plot_hist(ax, counts, edges, color="orange", edgecolor="black")
+    ax.set_title("Temperature Frequency (Failure Type = Overheating)")
+    ax.set_xlabel("Temperature")
+    ax.set_ylabel("Frequency")
+
+    ax = axes[0, 1]
+    for s, color in zip([0, 1], sns.color_palette("Set1", 2)):
+        m = oh.loc[oh["maintenance_required"] == s]
+        ax.scatter(m["temperature"], m["vibration"], color=color, alpha=0.6, s=15,
+                   label=str(s), rasterized=True)
+    ax.set_title("Temperature vs Vibration (Overheating Cases)")
+    ax.set_xlabel("Temperature")
+    ax.set_ylabel("Vibration")
+    ax.legend(title="Maintenance Required")
+
+    # sns.lineplot 은 x 값마다 평균 + 부트스트랩 신뢰구간을 계산해서 행이 많으면 느림
+    # → 온도 구간별 평균 잔여수명을 한 번에 계산해서 선으로 그림
+    ax = axes[1, 0]
+    valid = oh[["temperature", "predicted_remaining_life"]].dropna()
+    n, edges = np.histogram(valid["temperature"], bins=p["detail_bins"])
+    total, _ = np.histogram(valid["temperature"], bins=edges, weights=valid["predicted_remaining_life"])
+    centers = (edges[:-1] + edges[1:]) / 2
+    ax.plot(centers[n > 0], total[n > 0] / n[n > 0], color="red", linewidth=2)
+    ax.set_title("Predicted Remaining Life by Temperature (Overheating)")
+    ax.set_xlabel("Temperature")
+    ax.set_ylabel("Predicted Remaining Life")
+
+    ax = axes[1, 1]
+    ax.scatter(oh["temperature"], oh["predicted_remaining_life"], alpha=0.6, color="red",
+               marker="x", rasterized=True)
+    ax.set_title("Temperature vs Predicted Remaining Life (Overheating)")
+    ax.set_xlabel("Temperature")
+    ax.set_ylabel("Predicted Remaining Life")
+    for ax in axes.flat:
+        ax.grid(True)
+    return fig
+
+
+# 제외 조건 적용 후 진동 / 잔여수명 분포
+# - 노트북의 Vibration Issue 그림은 제목과 달리 온도를 그리고 있어서 진동으로 바로잡음
+# - 그 그림의 제외 조건은 노트북 그대로 온도 조건 없이 (진동 > 기준 | 수명 < 기준)
+#   (노트북의 "vibration > 90 | vibration > 80" 은 진동 > 80 과 같음)
+#   나머지 두 그림은 DataResult.ipynb 25, 26 셀처럼 공통 제외 조건(_exclude_strict) 사용
+@cell("remaining_hist", "Vibration / Remaining Life Frequency (After Filtering)",
+      columns=["temperature", "vibration", "predicted_remaining_life", "failure_type"],
+      params=["temp_threshold", "vib_threshold", "life_threshold", "detail_bins"])
+def cell_remaining_hist(ctx):
+    df, p = ctx["df"], ctx["params"]
+    remaining = df.loc[~_exclude_strict(df, p)]
+    no_vib = df.loc[~((df["vibration"] > p["vib_threshold"]) |
+                      (df["predicted_remaining_life"] < p["life_threshold"]))]
+    panels = [
+        (no_vib.loc[no_vib["failure_type"] == "Vibration Issue", "vibration"], "green",
+         "vibration Frequency (Failure Type = Vibration Issue)"),
+        (remaining["vibration"], "green", "vibration Frequency"),
+        (remaining["predicted_remaining_life"], "gray", "predicted_remaining_life Frequency"),
+    ]
+    fig, axes = plt.subplots(1, 3, figsize=(24, 5))
+    for ax, (values, color, title) in zip(axes, panels):
+        counts, edges = hist_counts(values, bins=p["detail_bins"])
+        plot_hist(ax, counts, edges, color=color, edgecolor="black")
+        ax.set_title(title)
+        ax.set_xlabel(values.name)
+        ax.set_ylabel("Frequency")
+        ax.grid(True)
+    return fig
+
+
+# 예외 조건(센서 정상인데 정비 필요)에 해당하는 machine_id별 개수
+@cell("exception_machines", "예외 조건 machine_id별 개수",
+      columns=["machine_id", "temperature", "vibration", "predicted_remaining_life",
+               "maintenance_required"],
+      params=["temp_threshold", "vib_threshold", "life_threshold"])
+def cell_exception_machines(ctx):
+    df, p = ctx["df"], ctx["params"]
+    exception_df = df[
+        (df["temperature"] <= p["temp_threshold"]) &
+        (df["vibration"] <= p["vib_threshold"]) &
+        (df["predicted_remaining_life"] >= p["life_threshold"]) &
+        (df["maintenance_required"] == 1)
+    ]
+    counts = exception_df["machine_id"].value_counts().rename_axis("machine_id").reset_index(name="count")
+    return counts.to_string(index=False)
+
+
+# 예외 조건 데이터의 failure_type × machine_id 개수 (고장유형별로 많이 발생한 기계부터)
+@cell("exception_failure_machines", "예외 조건 failure_type × machine_id별 개수",
+      columns=["machine_id", "failure_type", "temperature", "vibration",
+               "predicted_remaining_life", "maintenance_required"],
+      params=["temp_threshold", "vib_threshold", "life_threshold"])
+def cell_exception_failure_machines(ctx):
+    df, p = ctx["df"], ctx["params"]
+    exception_df = df[
+        (df["temperature"] <= p["temp_threshold"]) &
+        (df["vibration"] <= p["vib_threshold"]) &
+        (df["predicted_remaining_life"] >= p["life_threshold"]) &
+        (df["maintenance_required"] == 1)
+    ]
+    detail = (
+        exception_df.groupby(["failure_type", "machine_id"]).size().reset_index(name="count")
+        .sort_values(by=["failure_type", "count"], ascending=[True, False])
+    )
+    return detail.to_string(index=False)
+
+
+# 제외 조건 적용 후 maintenance_required==1 인 데이터의 machine_status 별 개수
+# - 노트북은 >, < 조건(result.ipynb)과 >=, < 조건(DataResult.ipynb) 두 가지로 확인
+@cell("remaining_status", "제외 조건 적용 후 정비 필요 데이터의 machine_status 개수",
+      columns=["temperature", "vibration", "predicted_remaining_life", "maintenance_required",
+               "machine_status"],
+      params=["temp_threshold", "vib_threshold", "life_threshold"])
+def cell_remaining_status(ctx):
+    df, p = ctx["df"], ctx["params"]
+    inclusive = (
+        (df["temperature"] >= p["temp_threshold"]) |
+        (df["vibration"] >= p["vib_threshold"]) |
+        (df["predicted_remaining_life"] < p["life_threshold"])
+    )
+    lines = []
+    for label, exclude in [("온도 >, 진동 >, 수명 <", _exclude_strict(df, p)),
+                           ("온도 >=, 진동 >=, 수명 <", inclusive)]:
+        remaining = df.loc[~exclude]
+        counts = remaining.loc[remaining["maintenance_required"] == 1, "machine_status"]
+        lines += [f"제외 조건: {label}", counts.value_counts().sort_index().to_string(), ""]
+    return "\n".join(lines)
+
+
+# 제외 조건을 하나씩 늘려 가며 본 유지보수 여부별 센서 히스토그램 (노트북 32~36 셀)
+@cell("maintenance_hist_no_failure", "Sensors by Maintenance Status (status != 2)",
+      columns=["machine_status", "maintenance_required"] + SENSOR_METRICS, params=["sensor_bins"])
+def cell_maintenance_hist_no_failure(ctx):
+    df, p = ctx["df"], ctx["params"]
+    exclude = df["machine_status"] == 2
+    return _maintenance_hist(df.loc[~exclude], SENSOR_METRICS, p["sensor_bins"])
+
+
+@cell("maintenance_hist_no_failure_temp", "Sensors by Maintenance Status (status != 2, temperature < threshold)",
+      columns=["machine_status", "maintenance_required"] + SENSOR_METRICS,
+      params=["sensor_bins", "temp_threshold"])
+def cell_maintenance_hist_no_failure_temp(ctx):
+    df, p = ctx["df"], ctx["params"]
+    exclude = (df["machine_status"] == 2) | (df["temperature"] >= p["temp_threshold"])
+    return _maintenance_hist(df.loc[~exclude], SENSOR_METRICS, p["sensor_bins"])
+
+
+@cell("maintenance_hist_no_failure_temp_vib",
+      "Sensors by Maintenance Status (status != 2, temperature / vibration < threshold)",
+      columns=["machine_status", "maintenance_required"] + SENSOR_METRICS,
+      params=["sensor_bins", "temp_threshold", "vib_threshold"])
+def cell_maintenance_hist_no_failure_temp_vib(ctx):
+    df, p = ctx["df"], ctx["params"]
+    exclude = (
+        (df["machine_status"] == 2) |
+        (df["temperature"] >= p["temp_threshold"]) |
+        (df["vibration"] >= p["vib_threshold"])
+    )
+    return _maintenance_hist(df.loc[~exclude], SENSOR_METRICS, p["sensor_bins"])
+
+
+@cell("maintenance_hist_inclusive", "Sensors by Maintenance Status (temperature >= / vibration >= / life <= excluded)",
+      columns=["predicted_remaining_life", "maintenance_required"] + SENSOR_METRICS,
+      params=["sensor_bins", "temp_threshold", "vib_threshold", "life_threshold"])
+def cell_maintenance_hist_inclusive(ctx):
+    df, p = ctx["df"], ctx["params"]
+    exclude = (
+        (df["temperature"] >= p["temp_threshold"]) |
+        (df["vibration"] >= p["vib_threshold"]) |
+        (df["predicted_remaining_life"] <= p["life_threshold"])
+    )
+    return _maintenance_hist(df.loc[~exclude], SENSOR_METRICS, p["sensor_bins"])
+
+
+@cell("maintenance_hist_strict", "Sensors by Maintenance Status (temperature > / vibration > / life < excluded)",
+      columns=["predicted_remaining_life", "maintenance_required"] + SENSOR_METRICS,
+      params=["sensor_bins", "temp_threshold", "vib_threshold", "life_threshold"])
+def cell_maintenance_hist_strict(ctx):
+    df, p = ctx["df"], ctx["params"]
+    return _maintenance_hist(df.loc[~_exclude_strict(df, p)], SENSOR_METRICS, p["sensor_bins"])
+
+
+# 기준 밖(제외 조건 통과) 데이터 중 정비 필요 데이터의 machine_status 개수 막대그래프
+# - 노트북의 xticks([2, 1, 0], ...) 는 라벨 순서가 뒤집혀 있어서 0, 1, 2 순서로 바로잡음
+@cell("threshold_status_bar", "Machine Status in Data Outside Thresholds (Maintenance Required = 1)",
+      columns=["temperature", "vibration", "predicted_remaining_life", "maintenance_required",
+               "machine_status"],
+      params=["temp_threshold", "vib_threshold", "life_threshold"])
+def cell_threshold_status_bar(ctx):
+    df, p = ctx["df"], ctx["params"]
+    exclude = (
+        (df["temperature"] >= p["temp_threshold"]) |
+        (df["vibration"] >= p["vib_threshold"]) |
+        (df["predicted_remaining_life"] < p["life_threshold"])
+    )
+    remaining = df.loc[~exclude]
+    status_counts = (remaining.loc[remaining["maintenance_required"] == 1, "machine_status"]
+                     .value_counts().reindex([0, 1, 2], fill_value=0))
+    fig, ax = plt.subplots(figsize=(6, 4))
+    bars = ax.bar(range(3), status_counts.to_numpy(), color=sns.color_palette("Set2", 3))
+    ax.bar_label(bars)
+    ax.set_title("Machine Status in Data Outside Thresholds\n(Maintenance Required = 1)")
+    ax.set_xlabel("Machine Status")
+    ax.set_ylabel("Count")
+    ax.set_xticks([0, 1, 2], ["Idle (0)", "Working (1)", "Failure (2)"])
+    ax.grid(axis="y")
+    return fig
+
+
+# mainO_data.py : cond × anomaly_flag / downtime_risk 교차표
+@cell("maintenance_crosstab", "cond × anomaly_flag / downtime_risk (machine_status 0/1)",
+      columns=["machine_status", "temperature", "vibration", "anomaly_flag", "downtime_risk"],
+      params=["temp_threshold", "vib_threshold"])
+def cell_maintenance_crosstab(ctx):
+    df, p = ctx["df"], ctx["params"]
+    ms01 = df["machine_status"].isin([0, 1])
+    cond = (df["temperature"] >= p["temp_threshold"]) | (df["vibration"] >= p["vib_threshold"])
+    sub = df.loc[ms01, ["anomaly_flag", "downtime_risk"]].astype(int)
+    sub["cond"] = cond.loc[ms01].astype(int)
+
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    for row, (col, cmap) in enumerate([("anomaly_flag", "Blues"), ("downtime_risk", "Greens")]):
+        ct = pd.crosstab(sub["cond"], sub[col]).reindex(index=[0, 1], columns=[0, 1], fill_value=0)
+        row_pct = ct.div(ct.sum(axis=1), axis=0) * 100
+        sns.heatmap(ct, ax=axes[row, 0], cmap=cmap, annot=True, fmt="d", square=True,
+                    linewidths=0.5, linecolor="white", cbar=True)
+        sns.heatmap(row_pct, ax=axes[row, 1], cmap=cmap, annot=True, fmt=".1f", vmin=0, vmax=100,
+                    square=True, linewidths=0.5, linecolor="white", cbar=True)
+        axes[row, 0].set_title(f"Counts: cond × {col}")
+        axes[row, 1].set_title(f"Row %: P({col} | cond) [%]")
+        for ax in axes[row]:
+            ax.set_xlabel(f"{col} (0/1)")
+            ax.set_ylabel("cond (0/1)")
+    return fig
+
+
+# mainO_data_rate.py : 상태/이상/위험도별 유지보수 비율과 RUL 분포
+@cell("maintenance_rate", "Maintenance relationships (status / anomaly / downtime_risk / RUL)",
+      columns=["machine_status", "maintenance_required", "anomaly_flag", "downtime_risk",
+               "predicted_remaining_life"],
+      params=["rul_bin_width"])
+def cell_maintenance_rate(ctx):
+    df, p = ctx["df"], ctx["params"]
+    d = df[["machine_status", "predicted_remaining_life"]].copy()
+    for c in ["maintenance_required", "anomaly_flag", "downtime_risk"]:
+        d[c] = df[c].astype(int)
+
+    ct = pd.crosstab(d["machine_status"], d["maintenance_required"]).reindex(
+        index=sorted(d["machine_status"].dropna().unique()), columns=[0, 1], fill_value=0
+    )
+    ct_ratio = ct.div(ct.sum(axis=1), axis=0) * 100
+
+    bw = p["rul_bin_width"]
+    max_v = np.ceil(d["predicted_remaining_life"].max() / bw) * bw
+    bins = np.arange(0, max_v + bw, bw)
+
+    fig, axes = plt.subplots(2, 2, figsize=(16, 9), constrained_layout=True)
+    ct_ratio.plot(kind="bar", stacked=True, ax=axes[0, 0], width=0.75, color=["C0", "C1"])
+    axes[0, 0].set_title("maintenance rate by machine_status")
+    axes[0, 0].set_ylabel("maintenance rate [%]")
+    for ax, col in [(axes[0, 1], "anomaly_flag"), (axes[1, 0], "downtime_risk")]:
+        rate = d.groupby(col)["maintenance_required"].mean().reindex([0, 1]) * 100
+        rate.plot(kind="bar", ax=ax, width=0.7, color=["C0", "C1"])
+        ax.set_title(f"maintenance rate by {col}")
+        ax.set_xlabel(f"{col} (0/1)")
+        ax.set_ylabel("maintenance rate [%]")
+        ax.set_ylim(0, 100)
+        ax.set_xticklabels(["0", "1"], rotation=0)
+    ax = axes[1, 1]
+    for s in [0, 1]:
+        counts, edges = hist_counts(d.loc[d["maintenance_required"] == s, "predicted_remaining_life"],
+                                    bins=bins)
+        plot_hist(ax, counts, edges, alpha=0.5, edgecolor="black", label=f"maintenance = {s}")
+    ax.set_title("RUL distribution")
+    ax.set_xlabel("predicted_remaining_life")
+    ax.set_ylabel("count")
+    ax.legend()
+    return fig
+
+
+# mainX_data.py : 유지보수와 관계없는 센서의 히스토그램 + ECDF
+@cell("distributions", "Histogram / CDF: humidity, pressure, energy_consumption",
+      columns=["maintenance_required", "humidity", "pressure", "energy_consumption"],
+      params=["hist_bins"])
+def cell_distributions(ctx):
+    df, p = ctx["df"], ctx["params"]
+    features = ["humidity", "pressure", "energy_consumption"]
+    statuses = sorted(df["maintenance_required"].dropna().unique())
+    fig, axes = plt.subplots(2, 3, figsize=(18, 9), sharex="col", sharey="row")
+    for j, feature in enumerate(features):
+        for s in statuses:
+            sub = df.loc[df["maintenance_required"] == s, feature].dropna()
+            if sub.empty:
+                continue
+            label = f"maintenance_required ({s})"
+            counts, edges = hist_counts(sub, bins=p["hist_bins"])
+            plot_hist(axes[0, j], counts, edges, alpha=0.35, edgecolor="black", label=label)
+            plot_ecdf(axes[1, j], *ecdf_decimated(sub), label=label)
+        axes[0, j].set_title(f"Histogram (Count): {feature}")
+        axes[0, j].set_ylabel("Count")
+        axes[1, j].set_title(f"CDF: {feature}")
+        axes[1, j].set_xlabel(feature)
+        axes[1, j].set_ylabel("CDF")
+        axes[1, j].set_ylim(0, 1)
+        for ax in axes[:, j]:
+            ax.grid(alpha=0.3)
+            ax.legend()
+    return fig
+
+
+# m2_check.py : 제외조건 적용 후 남은 데이터의 maintenance_required==1 여부
+@cell("exception_check", "제외조건 적용 후 maintenance_required==1 검증",
+      columns=["machine_status", "temperature", "vibration", "predicted_remaining_life",
+               "maintenance_required"],
+      params=["temp_threshold", "vib_threshold", "life_threshold"])
+def cell_exception_check(ctx):
+    df, p = ctx["df"], ctx["params"]
+    exclude_condition = (
+        (df["machine_status"].isin([0, 1])) |
+        (df["temperature"] >= p["temp_threshold"]) |
+        (df["vibration"] >= p["vib_threshold"]) |
+        (df["predicted_remaining_life"] <= p["life_threshold"])
+    )
+    remaining = df.loc[~exclude_condition]
+    total, rem_n = len(df), len(remaining)
+    cnt = int((remaining["maintenance_required"] == 1).sum())
+    return "\n".join([
+        f"전체 rows: {total:,}",
+        f"remaining rows: {rem_n:,} (전체 대비 {rem_n/max(total, 1)*100:.2f}%)",
+        f"remaining 중 maintenance_required==1: {cnt:,} (remaining 대비 {cnt/max(rem_n, 1)*100:.2f}%)",
+    ])
+
+
+# test1.py : maintenance_required == 1 일 때 센서 바이올린 플롯
+@cell("violin", "Violin plot (maintenance_required = 1)",
+      columns=["maintenance_required", "temperature", "vibration", "humidity"])
+def cell_violin(ctx):
+    df = ctx["df"]
+    m1 = df.loc[df["maintenance_required"] == 1]
+    cols = ["temperature", "vibration", "humidity"]
+    fig, ax = plt.subplots()
+    plot_violin(ax, [m1[c] for c in cols], showmeans=True)
+    ax.set_xticks([1, 2, 3], ["Temperature", "Vibration", "Humidity"])
+    ax.set_title("Violin plot (maintenance_required = 1)")
+    ax.set_ylabel("Value")
+    return fig
+
+
+# ======================================
+# 지문(hash) 계산
+# ======================================
+
+def _sha1(*parts):
+    h = hashlib.sha1()
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+# 파일 크기 + 수정시각으로 만든 빠른 지문
+# - 이 값이 이전 빌드와 같으면 CSV를 다시 읽지도 않음
+def file_fingerprint(csv_path):
+    st = os.stat(csv_path)
+    return _sha1(os.path.abspath(csv_path), st.st_size, st.st_mtime_ns)
+
+
+# 컬럼별 데이터 지문
+# - 파일이 바뀌었을 때, 실제로 값이 바뀐 컬럼을 쓰는 셀만 다시 계산하기 위해 사용
+def column_fingerprints(df):
+    return {
+        c: _sha1(pd.util.hash_pandas_object(df[c], index=False).to_numpy().tobytes())
+        for c in df.columns
+    }
+
+
+# 함수 코드가 이름으로 참조하는 전역 이름 (컴프리헨션 등 안쪽 코드 포함)
+def _global_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _global_names(const)
+    return names
+
+
+# 셀 코드 지문
+# - 셀 함수에서 시작해서, 참조하는 TRACKED_MODULES 의 함수 소스와 기본 인자 값,
+#   전역 상수(숫자/문자열/리스트/dict/Timedelta 등) 값을 따라가며 모두 모음
+#   (스크립트로 실행해도 import 해도 같은 키가 나오도록 모듈 이름은 넣지 않음)
+# - fast_plots.ECDF_MAX_ERROR, data_quality.GAP_FACTOR 같은 설정이나 도우미 함수만 바뀌어도
+#   그것을 쓰는 셀이 다시 실행됨
+def code_fingerprint(funcs):
+    parts, seen, stack = set(), set(), list(funcs)
+    while stack:
+        f = stack.pop()
+        if f in seen:
+            continue
+        seen.add(f)
+        parts.add(f"{f.__qualname__}:{inspect.getsource(f)}:{f.__defaults__!r}")
+        for name in _global_names(f.__code__):
+            if name not in f.__globals__:
+                continue
+            value = f.__globals__[name]
+            if inspect.isfunction(value):
+                if value.__module__ in TRACKED_MODULES:
+                    stack.append(value)
+            elif isinstance(value, (int, float, str, list, tuple, dict, pd.Timedelta)):
+                parts.add(f"{name}={value!r}")
+    return _sha1(*sorted(parts))
+
+
+# 셀 하나의 캐시 키 = 셀 코드(+ 의존 코드/설정) + 사용 파라미터 + 사용 컬럼 지문
+def cell_key(c, params, col_fp):
+    cols = sorted(col_fp) if c["columns"] == ["*"] else c["columns"]
+    return _sha1(
+        code_fingerprint([c["func"]] + c["deps"]),
+        json.dumps({k: params[k] for k in c["params"]}, sort_keys=True),
+        *[f"{col}={col_fp.get(col, 'missing')}" for col in cols],
+    )
+
+
+# ======================================
+# 빌드
+# ======================================
+
+# 리포트를 만드는 함수
+# - 입력: CSV 경로, 출력 폴더, 파라미터(기본값 덮어쓰기), force(전체 재실행)
+# - 출력: 이번 빌드에서 다시 실행된 셀 이름 목록
+# - 결과물: out_dir/report.md, out_dir/figures/*.png, out_dir/text/*.txt, out_dir/manifest.json
+def build_report(csv_path, out_dir="report", params=None, force=False, chunksize=None):
+    params = {**DEFAULT_PARAMS, **(params or {}), "chunksize": chunksize}
+    os.makedirs(os.path.join(out_dir, "figures"), exist_ok=True)
+    os.makedirs(os.path.join(out_dir, "text"), exist_ok=True)
+
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    manifest = {"file": None, "columns": {}, "cells": {}}
+    if os.path.exists(manifest_path) and not force:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+    # 파일이 그대로면 이전 컬럼 지문을 재사용 (CSV 로딩 생략)
+    fp = file_fingerprint(csv_path)
+    ctx = {"df": None, "quality": None, "params": params}
+    if manifest["file"] == fp:
+        col_fp = manifest["columns"]
+    else:
+        ctx["df"], ctx["quality"] = load_with_validation(csv_path, chunksize=chunksize)
+        col_fp = column_fingerprints(ctx["df"])
+
+    rerun = []
+    for c in CELLS:
+        key = cell_key(c, params, col_fp)
+        prev = manifest["cells"].get(c["name"])
+        if prev and prev["key"] == key and os.path.exists(os.path.join(out_dir, prev["output"])):
+            continue
+
+        # 오래된(stale) 셀만 실행. 데이터가 아직 없으면 이때 처음 로딩
+        if ctx["df"] is None:
+            ctx["df"], ctx["quality"] = load_with_validation(csv_path, chunksize=chunksize)
+        result = c["func"](ctx)
+
+        if isinstance(result, plt.Figure):
+            output = os.path.join("figures", f"{c['name']}-{key[:12]}.png")
+            result.savefig(os.path.join(out_dir, output), dpi=params["dpi"], bbox_inches="tight")
+            plt.close(result)
+        else:
+            output = os.path.join("text", f"{c['name']}.txt")
+            with open(os.path.join(out_dir, output), "w", encoding="utf-8") as f:
+                f.write(str(result))
+
+        # 이전 그림 파일은 지워서 캐시 폴더가 계속 커지지 않게 함
+        if prev and prev["output"] != output and os.path.exists(os.path.join(out_dir, prev["output"])):
+            os.remove(os.path.join(out_dir, prev["output"]))
+        manifest["cells"][c["name"]] = {"key": key, "output": output}
+        rerun.append(c["name"])
+
+    manifest["file"] = fp
+    manifest["columns"] = col_fp
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    _write_markdown(out_dir, manifest)
+    return rerun
+
+
+# manifest 를 보고 report.md 를 다시 조립 (그림은 링크만 걸어서 파일 크기를 작게 유지)
+def _write_markdown(out_dir, manifest):
+    lines = ["# SmartManufacturing 분석 결과", ""]
+    for c in CELLS:
+        entry = manifest["cells"].get(c["name"])
+        if entry is None:
+            continue
+        lines += [f"## {c['title']}", ""]
+        if entry["output"].startswith("figures"):
+            lines += [f"![{c['name']}]({entry['output'].replace(os.sep, '/')})", ""]
+        else:
+            with open(os.path.join(out_dir, entry["output"]), encoding="utf-8") as f:
+                lines += ["```", f.read(), "```", ""]
+    with open(os.path.join(out_dir, "report.md"), "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+
+if __name__ == "__main__":
+    import kagglehub           # Kaggle 데이터셋 다운로드
+
+    # 데이터셋 다운로드 : kagglehub가 데이터셋 내려받고, 로컬에 저장된 폴더 경로 반환
+    path = kagglehub.dataset_download(
+        "ziya07/smart-manufacturing-iot-cloud-monitoring-dataset"
+    )
+
+    import matplotlib
+    matplotlib.use("Agg")      # 화면 없이 파일로만 저장
+
+    rerun = build_report(find_csv(path), out_dir="report")
+    print("다시 실행한 셀:", rerun or "없음 (모두 캐시 사용)")
@@ -2,6 +2,7 @@ import os
 import pandas as pd
 import kagglehub
 import matplotlib.pyplot as plt
+from fast_plots import plot_violin
 # 데이터셋 다운로드
 path = kagglehub.dataset_download(
     "ziya07/smart-manufacturing-iot-cloud-monitoring-dataset"
@@ -54,13 +55,15 @@ energy= df[df['maintenance_required'] == 1]['energy_consumption']
 # 그래프 그리기
 plt.figure()
 # 바이올릿 플롯으로 그래프 표현
-plt.violinplot(
+# - 원본 배열 대신 고정 격자 KDE만 넘겨서 행 수와 관계없이 빠르게 그림
+plot_violin(
+    plt.gca(),
     [temp.values, vib.values, humid.values],
     showmeans=True
 )
 
-plt.xticks([1, 2], ['Temperature', 'Vibration', 'Humidity'])
-plt.title("Violin plot of Temperature and Vibration\n(maintenance_required = 1)")
+plt.xticks([1, 2, 3], ['Temperature', 'Vibration', 'Humidity'])
+plt.title("Violin plot of Temperature, Vibration and Humidity\n(maintenance_required = 1)")
 plt.ylabel("Value")
 plt.show()
 
@@ -0,0 +1,35 @@
+# 저장소 루트의 스크립트 모듈(data_quality.py 등)을 테스트에서 import 할 수 있게 경로 추가
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# 약 1분에 한 행, 50대 기계 중 임의의 기계가 기록하는 정상 데이터 (실제 데이터와 같은 모양)
+def make_frame(n=20000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "timestamp": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(n), unit="min"),
+        "machine_id": rng.integers(1, 51, n),
+        "machine_status": rng.integers(0, 3, n),
+        "temperature": rng.normal(70, 10, n),
+        "vibration": rng.uniform(0, 100, n),
+        "humidity": rng.uniform(20, 80, n),
+        "pressure": rng.uniform(1, 5, n),
+        "energy_consumption": rng.uniform(0, 10, n),
+        "predicted_remaining_life": rng.uniform(0, 500, n),
+        "maintenance_required": rng.integers(0, 2, n),
+        "anomaly_flag": rng.integers(0, 2, n),
+        "downtime_risk": rng.integers(0, 2, n),
+        "failure_type": "Normal",
+    })
+
+
+# 테스트 함수에서 make_frame(n, seed) 로 쓰는 fixture
+@pytest.fixture(name="make_frame")
+def make_frame_fixture():
+    return make_frame
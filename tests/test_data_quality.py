@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+from data_quality import (DUP_HORIZON, MAX_STATUS_CODES, load_with_validation, new_quality_state,
+                          quality_report, validate_chunk)
+
+
+def run(df, chunksize=None, max_gap=None):
+    state = new_quality_state(max_gap)
+    step = chunksize or len(df)
+    for i in range(0, len(df), step):
+        validate_chunk(df.iloc[i:i + step], state)
+    return quality_report(state)
+
+
+def test_clean_irregular_data_is_ok(make_frame):
+    for chunksize in (None, 3000):
+        report = run(make_frame(), chunksize)
+        assert report["timestamp_gaps"] == 0
+        assert report["ok"]
+
+
+def test_long_silence_is_a_gap(make_frame):
+    df = make_frame()
+    df = df.drop(index=range(8000, 12000))   # 모든 기계가 약 3일 동안 기록 없음
+    for chunksize in (None, 3000):
+        report = run(df, chunksize)
+        assert report["timestamp_gaps"] == df["machine_id"].nunique()
+        assert not report["ok"]
+
+
+def test_explicit_max_gap(make_frame):
+    report = run(make_frame(), max_gap="1h")
+    assert report["timestamp_gaps"] > 0
+    assert report["gap_threshold"] == str(pd.Timedelta("1h"))
+
+
+def test_bool_and_string_flags_are_valid(make_frame):
+    df = make_frame(500)
+    df["maintenance_required"] = df["maintenance_required"].astype(bool)
+    df["anomaly_flag"] = df["anomaly_flag"].map({0: "False", 1: "True"})
+    df["downtime_risk"] = df["downtime_risk"].astype(str)
+    assert sum(run(df)["bad_flags"].values()) == 0
+
+    df.loc[0, "downtime_risk"] = "2"
+    assert run(df)["bad_flags"] == {"downtime_risk": 1}
+
+
+def test_duplicates_across_chunks(make_frame):
+    df = make_frame(6000)
+    dup = pd.concat([df.iloc[:4000], df.iloc[[3990, 3995]], df.iloc[4000:]], ignore_index=True)
+    for chunksize in (None, 1000):
+        assert run(dup, chunksize)["duplicate_keys"] == 2
+
+
+def test_recent_keys_are_bounded(make_frame):
+    df = make_frame(20000)
+    state = new_quality_state()
+    for i in range(0, len(df), 2000):
+        validate_chunk(df.iloc[i:i + 2000], state)
+    kept = state["_recent_keys"]
+    # 기계별 마지막 시점에서 DUP_HORIZON 이내의 키만 남아 있음 (약 1일치 = 1440행 + 청크 여유)
+    assert len(kept) < DUP_HORIZON / pd.Timedelta("1min") + 2000
+    assert kept["timestamp"].min() >= df["timestamp"].max() - DUP_HORIZON - pd.Timedelta("1D")
+
+
+def test_load_with_validation(tmp_path, make_frame):
+    path = tmp_path / "data.csv"
+    make_frame(3000).to_csv(path, index=False)
+    df, report = load_with_validation(str(path), chunksize=700)
+    assert len(df) == 3000
+    assert report["rows"] == 3000
+    assert report["ok"]
+
+
+def test_missing_columns(make_frame):
+    report = run(make_frame(500).drop(columns=["humidity", "failure_type"]))
+    assert report["missing_columns"] == ["humidity", "failure_type"]
+    assert not report["ok"]
+
+
+def test_out_of_range_sensors(make_frame):
+    df = make_frame(500)
+    df.loc[0, "temperature"] = 500
+    df.loc[1, "pressure"] = -1
+    df["humidity"] = df["humidity"].astype(object)
+    df.loc[2, "humidity"] = "abc"           # 숫자로 바뀌지 않는 값도 범위 이탈
+    report = run(df)
+    assert report["out_of_range"] == {"temperature": 1, "humidity": 1, "pressure": 1}
+    assert not report["ok"]
+
+
+def test_unknown_status_codes_are_capped(make_frame):
+    df = make_frame(500)
+    df.loc[:99, "machine_status"] = np.arange(100) + 10
+    for chunksize in (None, 30):
+        report = run(df, chunksize)
+        assert report["unknown_status"] == 100
+        assert len(report["unknown_status_codes"]) == MAX_STATUS_CODES
+        assert not report["ok"]
+
+
+def test_nulls_are_problems(make_frame):
+    df = make_frame(500)
+    df.loc[3, "temperature"] = np.nan
+    report = run(df)
+    assert report["null_counts"] == {"temperature": 1}
+    assert not report["ok"]
+
+
+def test_late_duplicate_is_counted_once(make_frame):
+    df = make_frame(3000)
+    late_dup = pd.concat([df.iloc[:2000], df.iloc[[1500]], df.iloc[2000:]], ignore_index=True)
+    for chunksize in (None, 700):
+        report = run(late_dup, chunksize)
+        assert (report["duplicate_keys"], report["out_of_order"]) == (1, 0)
+        assert report["timestamp_gaps"] == 0
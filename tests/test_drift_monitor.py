@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+from drift_monitor import (_ks_pvalue, drift_report, new_monitor, update_from_csv,
+                           update_monitor)
+
+
+# 약 1분에 한 행, 50대 기계 중 임의의 기계가 기록하는 센서 데이터
+def make_sensors(n=100_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "timestamp": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(n), unit="min"),
+        "machine_id": rng.integers(1, 51, n),
+        "temperature": rng.normal(70, 10, n),
+        "vibration": rng.uniform(0, 100, n),
+        "humidity": rng.uniform(20, 80, n),
+        "pressure": rng.uniform(1, 5, n),
+        "energy_consumption": rng.uniform(0, 10, n),
+        "predicted_remaining_life": rng.integers(0, 500, n),
+    })
+
+
+def test_ks_pvalue_is_one_at_zero_and_monotonic():
+    n, m = np.array(1000.0), np.array(200.0)
+    assert _ks_pvalue(np.array(0.0), n, m) == 1.0
+    d = np.linspace(0, 0.5, 2001)
+    p = _ks_pvalue(d, n, m)
+    assert np.all(np.diff(p) <= 1e-12)
+
+    # Kolmogorov 분포 값 (scipy.stats.kstwobign.sf)
+    big = np.array(1e12)
+    en = np.sqrt(big / 2)
+    for lam, expected in [(0.5, 0.963945), (1.0, 0.270000), (1.5, 0.022218)]:
+        assert abs(_ks_pvalue(np.array(lam / en), big, big) - expected) < 1e-5
+
+
+def test_edges_follow_reference_quantiles():
+    state = update_monitor(new_monitor(), make_sensors(20_000))
+    hist = sum(state["windows"].values()).sum(axis=0)       # (센서, 구간)
+    # 좁은 범위에 몰린 센서(pressure, energy_consumption)도 모든 구간에 값이 들어감
+    assert (hist > 0).all()
+
+
+def test_stationary_data_has_low_scores():
+    report = drift_report(update_monitor(new_monitor(), make_sensors()))
+    assert report["score"].max() < 1
+    assert report["drift"].mean() < 0.03
+
+
+def test_shift_ranks_first():
+    df = make_sensors()
+    shifted = (df["machine_id"] == 7) & (df["timestamp"] >= df["timestamp"].max() - pd.Timedelta("6D"))
+    df.loc[shifted, "temperature"] += 8
+    top = drift_report(update_monitor(new_monitor(), df)).iloc[0]
+    assert (top["machine_id"], top["sensor"], top["drift"]) == (7, "temperature", True)
+
+
+def test_state_is_bounded_by_kept_windows():
+    state = new_monitor(freq="1D", keep_windows=5)
+    update_monitor(state, make_sensors())
+    assert len(state["windows"]) == len(state["moments"]) == 5
+    report = drift_report(state)
+    assert report["n_ref"].sum() + report["n_cur"].sum() == 100_000 * 6
+
+
+def test_incremental_csv_matches_full_read(tmp_path):
+    text = make_sensors(30_000).to_csv(index=False)
+    path = tmp_path / "log.csv"
+    path.write_text(text)
+    full = update_from_csv(new_monitor(), path)
+
+    # 첫 실행 뒤에 행이 추가되고, 첫 실행 때 마지막 줄은 아직 쓰는 중(줄바꿈 없음)인 상황
+    # (격자 경계는 같은 것을 써야 히스토그램을 비교할 수 있음)
+    lines = text.splitlines(keepends=True)
+    path.write_text("".join(lines[:12_001]) + lines[12_001][:10])
+    state = new_monitor()
+    state["edges"] = full["edges"]
+    update_from_csv(state, path, block_bytes=100_000)
+    path.write_text(text)
+    update_from_csv(state, path, block_bytes=100_000)
+    update_from_csv(state, path)      # 새 행이 없으면 아무것도 바뀌지 않음
+
+    assert state["offsets"][str(path)] == len(text.encode())
+    for w in full["windows"]:
+        assert (state["windows"][w] == full["windows"][w]).all()
+        assert np.allclose(state["moments"][w], full["moments"][w])
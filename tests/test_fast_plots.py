@@ -0,0 +1,58 @@
+import numpy as np
+
+from fast_plots import ecdf_decimated, hist_counts, kde_stats
+
+
+def test_ecdf_decimated_error_bound_and_tails():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=50_000)
+    e = 0.001
+    xs, ys = ecdf_decimated(x, max_error=e)
+    assert xs[0] == x.min() and ys[0] == 0
+    assert xs[-1] == x.max() and ys[-1] == 1
+
+    # steps-post 로 그린 계단과 실제 ECDF 의 차이는 e 미만
+    grid = np.sort(x)
+    exact = np.arange(1, grid.size + 1) / grid.size
+    drawn = ys[np.searchsorted(xs, grid, side="right") - 1]
+    assert np.abs(drawn - exact).max() < e + 1e-12
+
+
+def test_small_input_is_exact_ecdf():
+    xs, ys = ecdf_decimated([3.0, 1.0, 2.0, np.nan])
+    assert xs.tolist() == [1.0, 2.0, 3.0]
+    assert ys.tolist() == [1 / 3, 2 / 3, 1.0]
+
+
+def test_hist_counts_matches_numpy():
+    x = np.random.default_rng(1).uniform(size=1000)
+    counts, edges = hist_counts(x, bins=20)
+    ref, ref_edges = np.histogram(x, bins=20)
+    assert (counts == ref).all() and np.allclose(edges, ref_edges)
+
+
+def test_kde_stats_integrates_to_one():
+    s = kde_stats(np.random.default_rng(2).normal(size=10_000))
+    assert abs(np.trapezoid(s["vals"], s["coords"]) - 1) < 0.05
+
+
+def test_hist_counts_empty_with_edges():
+    edges = np.arange(0, 50, 10)
+    counts, got = hist_counts(np.array([np.nan]), bins=edges)
+    assert counts.tolist() == [0, 0, 0, 0]
+    assert got.tolist() == edges.tolist()
+    counts, _ = hist_counts([], bins=5)
+    assert counts.tolist() == [0] * 5
+
+
+def test_kde_stats_with_outlier_and_large_n():
+    rng = np.random.default_rng(3)
+    s = kde_stats(np.r_[rng.normal(size=100_000), 1e4])
+    assert abs(np.trapezoid(s["vals"], s["coords"]) - 1) < 0.01
+    assert s["max"] == 1e4 and s["coords"][0] < s["min"]
+
+    # n 이 커서 대역폭이 격자 간격 수준이어도 정규분포 모양이 유지됨
+    s = kde_stats(rng.normal(size=2_000_000))
+    pdf = np.exp(-s["coords"] ** 2 / 2) / np.sqrt(2 * np.pi)
+    assert abs(np.trapezoid(s["vals"], s["coords"]) - 1) < 0.01
+    assert np.abs(s["vals"] - pdf).max() < 0.01
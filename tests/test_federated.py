@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+
+from federated import finalize, merge_partials, partial_from_frame
+
+
+def test_float_status_merges_with_int_status(make_frame):
+    df = make_frame(3000)
+    a, b = df.iloc[:1500].copy(), df.iloc[1500:].copy()
+    a["machine_status"] = a["machine_status"].astype(float)   # 결측이 있는 사이트는 float 로 읽힘
+
+    merged = merge_partials([partial_from_frame(a, site="a"), partial_from_frame(b, site="b")])
+    assert sorted(merged["status_maint"]) == ["0", "1", "2"]
+
+    res = finalize(merged)
+    expected = pd.crosstab(df["machine_status"], df["maintenance_required"])
+    assert res["ct"].index.tolist() == [0, 1, 2]
+    assert (res["ct"].to_numpy() == expected.to_numpy()).all()
+
+
+def test_merge_normalises_old_float_keys(make_frame):
+    p = partial_from_frame(make_frame(500))
+    old = dict(p, status_maint={f"{k}.0": v for k, v in p["status_maint"].items()})
+    merged = merge_partials([old, p])
+    assert sorted(merged["status_maint"]) == ["0", "1", "2"]
+    assert merged["status_maint"]["1"] == [2 * x for x in p["status_maint"]["1"]]
+
+
+def test_merged_sites_equal_single_pass(make_frame):
+    df = make_frame(6000, seed=3)
+    sites = [df.iloc[:1000], df.iloc[1000:3500], df.iloc[3500:]]
+    merged = finalize(merge_partials([partial_from_frame(s, site=str(i)) for i, s in enumerate(sites)]))
+    whole = finalize(partial_from_frame(df))
+
+    # 한 번에 계산한 결과 (mainO_data.py / mainO_data_rate.py 방식)
+    ms01 = df["machine_status"].isin([0, 1])
+    cond = ((df["temperature"] >= 90) | (df["vibration"] >= 80)).astype(int)
+    for c, key in [("anomaly_flag", "anom"), ("downtime_risk", "risk")]:
+        ct = pd.crosstab(cond[ms01], df.loc[ms01, c]).reindex(index=[0, 1], columns=[0, 1], fill_value=0)
+        assert (merged[f"ct_{key}"].to_numpy() == ct.to_numpy()).all()
+        rate = df.groupby(c)["maintenance_required"].mean().reindex([0, 1]) * 100
+        assert np.allclose(merged[f"p_maint_given_{key}"].to_numpy(), rate.to_numpy())
+
+    ct = pd.crosstab(df["machine_status"], df["maintenance_required"])
+    assert np.allclose(merged["ct_ratio"].to_numpy(), (ct.div(ct.sum(axis=1), axis=0) * 100).to_numpy())
+
+    rul = df["predicted_remaining_life"]
+    for s in [0, 1]:
+        counts = (np.floor(rul[df["maintenance_required"] == s] / 10) * 10).value_counts().sort_index()
+        got = merged["rul_hist"][s]
+        assert got[got > 0].to_dict() == {int(k): v for k, v in counts.items()}
+
+    # 분포 요약: 적률은 한 번에 계산한 값과 같고, 분위수 오차는 q_max_error 이하
+    dist = merged["distribution"]
+    assert np.allclose(dist.drop(columns="q_max_error").to_numpy(),
+                       whole["distribution"].drop(columns="q_max_error").to_numpy())
+    for (f, s), row in dist.iterrows():
+        x = df.loc[df["maintenance_required"] == s, f]
+        assert row["count"] == x.size
+        assert np.isclose(row["mean"], x.mean()) and np.isclose(row["std"], x.std())
+        assert (row["min"], row["max"]) == (x.min(), x.max())
+        for q in [0.05, 0.25, 0.5, 0.75, 0.95]:
+            exact = np.quantile(x, q, method="inverted_cdf")
+            assert abs(row[f"q{int(q * 100):02d}"] - exact) <= row["q_max_error"] + 1e-9
+
+
+def test_std_is_stable_for_large_mean(make_frame):
+    df = make_frame(4000)
+    rng = np.random.default_rng(5)
+    df["pressure"] = 1e9 + rng.normal(0, 1, len(df))     # 평균 ≫ 표준편차
+    config = {"features": ["pressure"]}
+    parts = [partial_from_frame(df.iloc[i:i + 500], config) for i in range(0, len(df), 500)]
+    dist = finalize(merge_partials(parts))["distribution"]
+    for s in [0, 1]:
+        x = df.loc[df["maintenance_required"] == s, "pressure"]
+        assert abs(dist.loc[("pressure", s), "std"] - x.std()) < 1e-6
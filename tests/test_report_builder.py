@@ -0,0 +1,33 @@
+import data_quality
+import fast_plots
+import report_builder
+
+
+def test_rebuild_runs_only_stale_cells(tmp_path, monkeypatch, make_frame):
+    csv_path = tmp_path / "data.csv"
+    make_frame(2000).to_csv(csv_path, index=False)
+    out = str(tmp_path / "report")
+
+    first = report_builder.build_report(str(csv_path), out_dir=out)
+    assert first == [c["name"] for c in report_builder.CELLS]
+    assert report_builder.build_report(str(csv_path), out_dir=out) == []
+
+    # 파라미터는 그 파라미터를 쓰는 셀만 다시 실행
+    rerun = report_builder.build_report(str(csv_path), out_dir=out, params={"detail_bins": 20})
+    assert sorted(rerun) == ["overheating", "remaining_hist"]
+
+    # fast_plots 설정이 바뀌면 그 도우미를 쓰는 셀만 다시 실행
+    monkeypatch.setattr(fast_plots.ecdf_decimated, "__defaults__", (0.01,))
+    rerun = report_builder.build_report(str(csv_path), out_dir=out, params={"detail_bins": 20})
+    assert rerun == ["distributions"]
+
+    # 품질 검사 설정이 바뀌면 품질 셀만 다시 실행
+    monkeypatch.setattr(data_quality, "GAP_FACTOR", 30)
+    rerun = report_builder.build_report(str(csv_path), out_dir=out, params={"detail_bins": 20})
+    assert rerun == ["quality"]
+
+    # 청크 크기가 바뀌면 품질 셀만 다시 실행
+    rerun = report_builder.build_report(str(csv_path), out_dir=out, params={"detail_bins": 20},
+                                        chunksize=500)
+    assert rerun == ["quality"]
+